@@ -1,17 +1,20 @@
 """
 TkEasyGUI utilities functions
 """
+from __future__ import annotations
 
 import os
 import platform
 import sys
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Literal, Union
+from typing import TYPE_CHECKING, Any, Literal, Union
 
-import PIL.Image
 import pyperclip  # type: ignore
 
+if TYPE_CHECKING:
+    import PIL.Image
+
 # define TypeAlias
 TextAlign = Literal["left", "right", "center"]
 TextVAlign = Literal["top", "bottom", "center"]
@@ -67,7 +70,7 @@ def is_win() -> bool:
 
 def screenshot() -> PIL.Image.Image:
     """Take a screenshot."""
-    import PIL.ImageGrab
+    import PIL.ImageGrab  # import on demand - PIL is heavy
     screen_image = PIL.ImageGrab.grab()
     return screen_image
 
@@ -233,7 +236,7 @@ def convert_color_html(color_name: str) -> str:
 # global variables
 # auto generate element key id
 _element_style_key_ids: dict[KeyType, int] = {}
-_element_key_names: dict[KeyType, bool] = {}
+_element_key_names: set[KeyType] = set() # set membership keeps key checks O(1)
 def generate_element_style_key(element_type: str) -> str:
     """Get a unique id for an element."""
     element_type = element_type.lower()
@@ -245,7 +248,7 @@ def generate_element_style_key(element_type: str) -> str:
         element_id = _element_style_key_ids[element_type]
         key = f"-{element_type}{element_id}-"
         if key not in _element_key_names:
-            _element_key_names[key] = True
+            _element_key_names.add(key)
             break
     return key
 
@@ -253,13 +256,13 @@ def register_element_key(key: KeyType) -> bool:
     """Register element key."""
     if key in _element_key_names:
         return False
-    _element_key_names[key] = True
+    _element_key_names.add(key)
     return True
 
 def remove_element_key(key: KeyType) -> bool:
     """Remove element key."""
     if key in _element_key_names:
-        _element_key_names.pop(key)
+        _element_key_names.discard(key)
         return True
     return False
 
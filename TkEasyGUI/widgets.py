@@ -1,22 +1,24 @@
 """
 TkEasyGUI Widgets
 """
+from __future__ import annotations
+
 import io
 import os
 import platform
 import sys
 import threading
+import time
 import tkinter as tk
 import tkinter.font as tkfont
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from queue import Queue
+from functools import lru_cache, partial
 from tkinter import font as tkinter_font
 from tkinter import scrolledtext, ttk
-from typing import Any, Callable, Optional, TypeAlias, Union
-
-import PIL
-from PIL import ImageColor, ImageTk
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, TypeAlias, Union
 
 from . import dialogs, utils, version
 from .utils import (
@@ -40,6 +42,23 @@ from .utils import (
     register_element_key,
 )
 
+if TYPE_CHECKING:
+    import PIL
+    import PIL.Image
+    from PIL import ImageColor, ImageTk
+else:
+    PIL = None # imported lazily @see _load_pil
+    ImageColor = None
+    ImageTk = None
+
+def _load_pil() -> None:
+    """Import PIL on first use - the import is heavy and windows without images never pay it."""
+    global PIL, ImageColor, ImageTk
+    if PIL is None:
+        import PIL
+        import PIL.Image
+        from PIL import ImageColor, ImageTk
+
 # ------------------------------------------------------------------------------
 # TypeAlias
 # ------------------------------------------------------------------------------
@@ -81,6 +100,97 @@ class TkEasyError(Exception):
         self.message = message
         super().__init__(self.message)
 
+
+class _RadioGroup:
+    """State of a radio button group. (shared tk variable and member keys)"""
+    __slots__ = ("var", "keys")
+    def __init__(self, var: tk.IntVar) -> None:
+        self.var = var
+        self.keys: list[str] = []
+
+# font metrics cache : (family, size) -> (width, height) @see Window._calc_font_size
+_font_metric_cache: dict[tuple[Union[str, None], Union[int, None]], tuple[int, int]] = {}
+
+# keyboard event name cache : (keysym, keycode) -> "keysym:keycode" @see Window._on_return_keyboard_event
+_keysym_event_names: dict[tuple[str, int], str] = {}
+
+# sentinel for attribute lookup @see Element.__getattr__
+_MISSING = object()
+
+# widget state by disabled flag - one tuple index instead of a branch
+_STATE_MAP = (tk.NORMAL, tk.DISABLED)
+
+# recycled tk variables - Vars belong to the shared root interpreter and
+# outlive their window, so closed windows donate them to later ones
+# @see Checkbox.create / Radio.create / Window.close
+_boolvar_pool: list[tk.BooleanVar] = []
+_intvar_pool: list[tk.IntVar] = []
+
+def _acquire_boolvar(value: bool) -> tk.BooleanVar:
+    """Get a BooleanVar from the pool (or a fresh one) set to value."""
+    if _boolvar_pool:
+        var = _boolvar_pool.pop()
+        var.set(value)
+        return var
+    return tk.BooleanVar(value=value)
+
+def _acquire_intvar(value: int) -> tk.IntVar:
+    """Get an IntVar from the pool (or a fresh one) set to value."""
+    if _intvar_pool:
+        var = _intvar_pool.pop()
+        var.set(value)
+        return var
+    return tk.IntVar(value=value)
+
+# tk index constants hoisted to module scope - skips two attribute probes
+# per use in the Input/Multiline editing helpers
+_TK_INSERT = tk.INSERT
+_TK_END = tk.END
+_TK_SEL = tk.SEL
+_TK_SEL_FIRST = tk.SEL_FIRST
+_TK_SEL_LAST = tk.SEL_LAST
+
+# shared system event tables - constructors reference these instead of
+# building a fresh dict per widget @see Element.bind_events
+_RIGHT_CLICK_BINDS = {"<Button-3>": "right_click"}
+_BUTTON_BINDS = {"<Button-3>": "right_click", "<Return>": "return"}
+_RETURN_BINDS = {"<Return>": "return"}
+_KEY_BINDS = {"<Key>": "key"}
+_FOCUS_BINDS = {
+    "<FocusIn>": "focusin",
+    "<FocusOut>": "focusout",
+    "<Button-1>": "click",
+    "<Button-3>": "right_click",
+}
+_SELECT_BINDS = {"<<ListboxSelect>>": "select"}
+_BROWSE_BINDS = {"<Button-1>": "--browse_action/hide", "<Return>": "--browse_action/hide"}
+_COMBO_BINDS = {"<<ComboboxSelected>>": "select"}
+_RELEASE_BINDS = {"<ButtonRelease-1>": "release"}
+_MOUSE_BINDS = {"<ButtonPress>": "mousedown", "<ButtonRelease>": "mouseup"}
+_MOUSE_MOVE_BINDS = {
+    "<ButtonPress>": "mousedown",
+    "<ButtonRelease>": "mouseup",
+    "<Motion>": "mousemove",
+}
+
+# justify -> anchor conversion table @see Element._justify_to_anchor
+_JUSTIFY_TO_ANCHOR: dict[str, str] = {"left": "w", "right": "e", "center": "center"}
+
+# window icon cache : icon bytes -> PhotoImage @see Window._set_icon
+_icon_images: dict[bytes, tk.PhotoImage] = {}
+
+def _get_icon_image(icon: bytes) -> tk.PhotoImage:
+    """Decode icon bytes once and reuse the PhotoImage across windows."""
+    image = _icon_images.get(icon)
+    if image is None:
+        image = _icon_images[icon] = tk.PhotoImage(data=icon)
+    return image
+
+# geometry format templates - percent formatting of ints is cheaper than f-strings
+_GEOM_LOC_FMT = "+%d+%d"
+_GEOM_SIZE_FMT = "%dx%d"
+
+
 class Window:
     """
     Main window object in TkEasyGUI
@@ -127,15 +237,19 @@ class Window:
         self.timeout: Union[int, None] = None
         self.timeout_key: str = WINDOW_TIMEOUT
         self.timeout_id: Union[str, None] = None
-        self.events: Queue = Queue() # Queue[key, values]
+        self.events: deque = deque() # deque[(key, values)] - append/popleft are atomic, no lock needed
         self.key_elements: dict[KeyType, "Element"] = {}
         self.last_values: dict[KeyType, Any] = {}
+        self._dirty_keys: set[KeyType] = set() # keys whose widgets fired events since last get_values
+        self._values_cache_valid: bool = False
+        self._elements_by_type: dict[str, list["Element"]] = {} # element type(lower) -> elements
+        self._value_getters: dict[KeyType, Callable] = {} # key -> bound Element.get
+        self._tracked_value_keys: set[KeyType] = set() # keys whose elements notify every change
         self.flag_alive: bool = True # Pressing the close button will turn this flag to False.
         self.layout: LayoutType = layout
         self._event_hooks: dict[KeyType, list[Callable]] = {}
         self.font: Union[FontType, None] = font
-        self.radio_group_dict: dict[str, tk.IntVar] = {} # [variable]
-        self.radio_group_dict_keys: dict[str, list[str]] = {}
+        self.radio_group_dict: dict[str, _RadioGroup] = {} # group_id -> group state
         self.checkbox_dict: dict[str, list[str]] = {}
         self.minimized: bool = False
         self.maximized: bool = False
@@ -146,8 +260,14 @@ class Window:
         self._grab_flag: bool = False
         self._start_x: Union[int, None] = None
         self._start_y: Union[int, None] = None
-        self._mouse_x: Union[int, None] = None
-        self._mouse_y: Union[int, None] = None
+        self._press_root_x: int = 0
+        self._press_root_y: int = 0
+        self._pending_geom: Union[tuple[int, int], None] = None
+        self._geom_after_id: Union[str, None] = None
+        self._configure_after_id: Union[str, None] = None
+        self._scrollregion_cache: Union[tuple[int, int, int, int], None] = None
+        self._geom_ready: bool = False # True after the window was shown once
+        self._read_entered: bool = False # True after the first Window.read call
         self.alpha_channel: float = alpha_channel
         self.enable_key_events: bool = enable_key_events
         self.return_keyboard_events: bool = return_keyboard_events
@@ -204,8 +324,6 @@ class Window:
         self._create_widget(self.frame, layout)
         # pack frame
         self.frame.rowconfigure(0, weight=1)
-        if keep_on_top:
-            self.window.attributes("-topmost", True)
         if no_titlebar:
             self.window.after_idle(self.hide_titlebar, True)
         if grab_anywhere:
@@ -213,16 +331,18 @@ class Window:
         # font
         if font is not None:
             self._calc_font_size(font)
-        # set hidden
-        self.window.attributes("-alpha", 0) # hidden window for calculating size
+        # window manager attributes - set in one call to avoid extra wm round trips
+        # (modal windows are kept on top as well @see _on_show_event)
+        attributes: list[Any] = []
+        if keep_on_top or modal:
+            attributes += ["-topmost", True]
+        attributes += ["-alpha", 0] # hidden window for calculating size
+        self.window.attributes(*attributes)
         # bind events
         if self.enable_key_events:
-            self.window.bind("<Key>", lambda e: self._event_handler(
-                WINDOW_KEY_EVENT,
-                {"event": e, "key": e.keysym, "event_type": "key", "window.key": self.key}))
+            self.window.bind("<Key>", self._on_key_event)
         if self.return_keyboard_events: # for compatibility with PySimpleGUI
-            self.window.bind("<Key>", lambda e: self._event_handler(
-                e.keysym if len(e.keysym) == 1 else f"{e.keysym}:{e.keycode}", {}))
+            self.window.bind("<Key>", self._on_return_keyboard_event)
         # push window
         self.parent_window: Union[Window, None] = _window_parent()
         _window_push(self)
@@ -247,6 +367,25 @@ class Window:
         self.update_idle_tasks()
         self.window.after_idle(self._on_show_event)
 
+    def _on_key_event(self, event: Any) -> None:
+        """Key event. @see enable_key_events"""
+        self._event_handler(
+            WINDOW_KEY_EVENT,
+            {"event": event, "key": event.keysym, "event_type": "key", "window.key": self.key})
+
+    def _on_return_keyboard_event(self, event: Any) -> None:
+        """Key event. (for compatibility with PySimpleGUI)"""
+        keysym = event.keysym
+        if len(keysym) == 1:
+            name = keysym
+        else:
+            # cache the formatted event name per (keysym, keycode)
+            cache_key = (keysym, event.keycode)
+            name = _keysym_event_names.get(cache_key)
+            if name is None:
+                name = _keysym_event_names[cache_key] = f"{keysym}:{event.keycode}"
+        self._event_handler(name, {})
+
     def _on_mouse_move(self, event):
         """Mouse move event."""
         self.post_event(WINDOW_MOUSE_EVENT, {"event": event, "event_type": "mousemove"})
@@ -261,8 +400,7 @@ class Window:
         alpha = self.alpha_channel
         self.set_alpha_channel(0)
         if self.modal:
-            # set modal action
-            self.window.attributes("-topmost", 1) # topmost
+            # set modal action (topmost is already set in __init__)
             # self.window.transient(parent)
             self.window.grab_set()
         # show
@@ -280,6 +418,11 @@ class Window:
                 self.move_to_center(center_pos=self.parent_window.get_center_location())
         # show window
         self.set_alpha_channel(alpha)
+        self._geom_ready = True
+        # materialize static frames (experimental) @see Frame.materialize
+        for frame_elem in self._elements_by_type.get("frame", ()):
+            if getattr(frame_elem, "_materialize_on_show", False):
+                self.window.after_idle(frame_elem.materialize)
 
     def _on_window_show(self, event: Any) -> None:
         values: dict[Union[str, int], Any] = self.get_values()
@@ -307,11 +450,11 @@ class Window:
 
     def post_event(self, key: KeyType, values: dict[KeyType, Any]) -> None:
         """Post an event."""
-        self.events.put((key, values))
+        self.events.append((key, values))
 
     def post_event_after(self, msec: int, key: KeyType, values: dict[KeyType, Any]) -> None:
         """Post an event after msec."""
-        self.window.after(msec, self.events.put, (key, values))
+        self.window.after(msec, self.events.append, (key, values))
 
     def set_timeout(self, callback: Callable, msec: int, *args, **kw) -> None:
         """Set a timeout event."""
@@ -319,10 +462,28 @@ class Window:
 
     def _on_frame_configure(self, _event):
         """Handle frame configure event."""
+        if self.canvas is None:
+            return
+        # coalesce bursts of <Configure> events into one update per idle cycle
+        if self._configure_after_id is not None:
+            return
+        self._configure_after_id = self.window.after_idle(self._update_scrollregion)
+
+    def invalidate_scroll_region(self) -> None:
+        """Recompute the scroll region. (call after changing the layout contents)"""
+        self._scrollregion_cache = None
+        self._update_scrollregion()
+
+    def _update_scrollregion(self) -> None:
+        """Update the scroll region. @see Window._on_frame_configure"""
+        self._configure_after_id = None
         # set scrollbar
         if self.canvas is None:
             return
         region = self.canvas.bbox("all")
+        if region == self._scrollregion_cache:
+            return # contents did not grow or shrink - keep the current region
+        self._scrollregion_cache = region
         self.canvas.configure(scrollregion=region)
         # set size
         pre_size = self.size
@@ -340,12 +501,11 @@ class Window:
 
     def set_location(self, xy: tuple[int, int]) -> None:
         """Set window location."""
-        self.window.geometry(f"+{xy[0]}+{xy[1]}")
+        self.window.geometry(_GEOM_LOC_FMT % (xy[0], xy[1]))
     
     def get_location(self) -> tuple[int, int]:
         """Get window location."""
-        loc = self.window.geometry().split("+")
-        return (int(loc[1]), int(loc[2]))
+        return (self.window.winfo_x(), self.window.winfo_y())
 
     def get_center_location(self) -> tuple[int, int]:
         """Get center location."""
@@ -414,25 +574,28 @@ class Window:
             layout_ej = layout
         # create widgets
         self.need_focus_widget: tk.Widget|None = None
+        # the parent is fixed for this call, so query its background only once
+        bgcolor = None
+        if parent is not None:
+            try:
+                bgcolor = parent.cget("background")
+            except Exception:
+                pass
+        base_frame_prop: dict[str, Any] = {"background": bgcolor} if bgcolor is not None else {}
+        parent_is_notebook = isinstance(parent, ttk.Notebook)
+        # one template for the per-row pack options, copied instead of rebuilt per row
+        row_pack_template: dict[str, Any] = {
+            "expand": False,
+            "fill": "x",
+            "side": valign,
+            "pady": self.row_padding,
+        }
         for row_no, widgets in enumerate(layout_ej):
-            bgcolor = None
-            if parent is not None:
-                try:
-                    bgcolor = parent.cget("background")
-                except Exception:
-                    pass
-            frame_prop = {"name": f"tkeasygui_frame_row_{row_no}"}
-            if bgcolor is not None:
-                frame_prop["background"] = bgcolor
-            frame_row = tk.Frame(parent, **frame_prop) # type: ignore
+            frame_row = tk.Frame(parent, name=f"tkeasygui_frame_row_{row_no}", **base_frame_prop) # type: ignore
+            elem_parent: Any = parent if parent_is_notebook else frame_row
             # columns
             prev_element: Union[Element, None] = None
-            row_pack_prop: dict[str, Any] = {
-                "expand": False,
-                "fill": "x",
-                "side": valign,
-                "pady": self.row_padding,
-            }
+            row_pack_prop: dict[str, Any] = row_pack_template.copy()
             # reversed?
             if align == "right":
                 widgets = reversed(widgets)  # type: ignore
@@ -451,9 +614,6 @@ class Window:
                 prev_element = elem
                 # create widget
                 try:
-                    elem_parent: Any = frame_row
-                    if type(parent) is ttk.Notebook:
-                        elem_parent = parent
                     widget: Any = elem.create(self, elem_parent)
                     widget.__tkeasygui = elem
                 except Exception as e:
@@ -464,6 +624,12 @@ class Window:
                 # check key
                 if elem.has_value or (elem.key is not None):
                     self.key_elements[elem.key] = elem
+                if elem.has_value:
+                    self._value_getters[elem.key] = elem.get
+                    if elem._notify_changes:
+                        self._tracked_value_keys.add(elem.key)
+                # index by element type
+                self._elements_by_type.setdefault(elem.element_type.lower(), []).append(elem)
                 # check focus widget
                 if elem.has_value and (self.need_focus_widget is None):
                     self.need_focus_widget = widget
@@ -485,21 +651,13 @@ class Window:
                 # bind event (before create)
                 for event_name, handle_t in elem._bind_dict.items():
                     self.bind(elem, event_name, handle_t[0], handle_t[1], handle_t[2])
-                # menu ?
-                if isinstance(elem, Menu):
-                    continue
-                # Tab?
-                if isinstance(parent, ttk.Notebook):
-                    # print("@@@@ TabGroup", type(parent), type(elem.widget), elem.get())
-                    parent.add(elem.widget, text=elem.get()) # type: ignore
-                    if isinstance(elem, Tab):
-                        group:TabGroup = parent.__tkeasygui # type: ignore
-                        tab: Tab = elem
-                        if group.max_rows > tab.rows:
-                            tab.rows = group.max_rows
-                        if group.max_cols > tab.cols:
-                            tab.cols = group.max_cols
+                # Menu and Tab need special handling instead of packing
+                if parent_is_notebook:
+                    # Notebook children are added as tabs instead of packed
+                    self._post_create_tab(elem, parent, frame_row)
                     continue
+                if isinstance(elem, Menu):
+                    continue # Menu configures the window itself - nothing to pack
                 # pack widget
                 fill_props = elem._get_pack_props(align, valign)
                 widget.pack(**fill_props)
@@ -516,22 +674,43 @@ class Window:
         if self.need_focus_widget is not None:
             self.need_focus_widget.focus_set()
 
+    def _post_create_tab(self, elem: "Element", parent: Any, frame_row: tk.Frame) -> None:
+        """Add an element to its parent Notebook instead of packing. @see _create_widget"""
+        # print("@@@@ TabGroup", type(parent), type(elem.widget), elem.get())
+        parent.add(elem.widget, text=elem.get()) # type: ignore
+        if isinstance(elem, Tab):
+            group:TabGroup = parent.__tkeasygui # type: ignore
+            tab: Tab = elem
+            if group.max_rows > tab.rows:
+                tab.rows = group.max_rows
+            if group.max_cols > tab.cols:
+                tab.cols = group.max_cols
+
     def _calc_font_size(self, font: FontType) -> None:
         """Calculate font size."""
-        font_obj = tkinter_font.Font()
+        # check the cache first - measuring costs several Tcl round-trips
+        cache_key: tuple[Union[str, None], Union[int, None]] = (None, None)
         if font is not None:
             if len(font) >= 2:
-                font_obj = tkinter_font.Font(family=font[0], size=font[1])
+                cache_key = (font[0], font[1])
             elif len(font) == 1:
-                font_obj = tkinter_font.Font(family=font[0])
+                cache_key = (font[0], None)
+        cached = _font_metric_cache.get(cache_key)
+        if cached is not None:
+            self.font_size_average = cached
+            return
+        font_obj = tkinter_font.Font()
+        if cache_key[0] is not None:
+            if cache_key[1] is not None:
+                font_obj = tkinter_font.Font(family=cache_key[0], size=cache_key[1])
+            else:
+                font_obj = tkinter_font.Font(family=cache_key[0])
         # calc measure
         # The letter 'M' is commonly used to represent the average width of a font in typography. This is because the 'M' is relatively wide, making it suitable for indicating width in comparison to other characters, especially in fixed-width (monospace) fonts.
-        m_size = font_obj.measure("M")
-        s_size = font_obj.measure("s")
-        a_size = font_obj.measure("A")
-        w = (m_size + s_size + a_size) // 3
+        # measure "MsA" with one call and take the average width of the three letters
+        w = font_obj.measure("MsA") // 3
         h = font_obj.metrics("linespace")
-        self.font_size_average = (w, h)
+        self.font_size_average = _font_metric_cache[cache_key] = (w, h)
     
     def move(self, x: int, y: int) -> None:
         """Move the window. (same as set_location)"""
@@ -574,21 +753,17 @@ class Window:
             pass
     def get_size(self) -> tuple[int, int]:
         """Get the window size."""
-        size = self.window.geometry().split("+")[0].split("x")
-        return (int(size[0]), int(size[1]))
+        if not self._geom_ready:
+            self.update_idle_tasks()
+        return (self.window.winfo_width(), self.window.winfo_height())
 
     def get_element_by_key(self, key: str) -> Union["Element", None]:
         """Get an element by its key."""
-        return self.key_elements[key] if key in self.key_elements else None
+        return self.key_elements.get(key)
     
     def get_elements_by_type(self, element_type: str) -> list["Element"]:
         """Get elements by type."""
-        result: list["Element"] = []
-        for rows in self.layout:
-            for elem in rows:
-                if elem.element_type.lower() == element_type.lower():
-                    result.append(elem)
-        return result
+        return list(self._elements_by_type.get(element_type.lower(), ()))
 
     def read(
         self,
@@ -611,10 +786,37 @@ class Window:
         values: dict[KeyType, Any] = {} # set default key and values
         # mainloop - read a event
         while True:
+            # timeout? check before the fast path so a steady event stream
+            # cannot starve the timeout event
+            if timeout is not None:
+                interval = time_checker_end(timeout_chcker_id)
+                if interval > timeout:
+                    self._has_last_event = True
+                    return (self.timeout_key, {}) # create timeout event
+            # fast path - events already queued? then skip the mainloop round-trip
+            if self.events:
+                self._has_last_event = True
+                key, values = self.events.popleft()
+                # _event_hooks
+                if key in self._event_hooks:
+                    flag_stop = self._dispatch_event_hooks(key, values)
+                    if flag_stop:
+                        key = f"{key}-stopped" # change event name
+                        self.invalidate_all()
+                        values = self.get_values() # collect values again
+                # If an event hidden from the user occurs, continue to use the mainloop.
+                if isinstance(key, str) and key.endswith("/hide"):
+                    continue # hide system events
+                # return a event
+                break
             # set timeout
             if self.timeout_id is not None:
                 self.window.after_cancel(self.timeout_id)
-            self.window.update_idletasks()
+            if not self._read_entered:
+                # flush pending idle work once; afterwards the scheduled idle
+                # handler already runs when Tk reaches the idle state
+                self.window.update_idletasks()
+                self._read_entered = True
             self.window.update()
             # set next event
             if self._has_last_event:
@@ -628,31 +830,14 @@ class Window:
             # -----------------------------------------------------
             # after mainloop, check events
             # -----------------------------------------------------
-            # timeout ?
-            if timeout is not None:
-                # check interval
-                interval = time_checker_end(timeout_chcker_id)
-                if interval > timeout:
-                    self._has_last_event = True
-                    key, values = (self.timeout_key, {}) # create timeout event
-                    return (key, values)
-            # get ui event
-            if self.events.empty():
+            # no event? then wait again in the mainloop
+            # (the loop re-checks the timeout before the next pop)
+            if not self.events:
                 self._has_last_event = False
-                continue
-            self._has_last_event = True
-            key, values = self.events.get()
-            # _event_hooks
-            if key in self._event_hooks:
-                flag_stop = self._dispatch_event_hooks(key, values)
-                if flag_stop:
-                    key = f"{key}-stopped" # change event name
-                    values = self.get_values() # collect values again
-            # If an event hidden from the user occurs, continue to use the mainloop.
-            if isinstance(key, str) and key.endswith("/hide"):
-                continue # hide system events
-            # return a event
-            break
+        if isinstance(values, _ValuesProxy):
+            # C-level copy idioms (dict(values) etc.) bypass the lazy proxy -
+            # fill it in completely before user code can copy it
+            values._materialize()
         return (key, values)
 
     def _check_focus_widget(self) -> None:
@@ -724,18 +909,20 @@ class Window:
     def _dispatch_event_hooks(self, key: KeyType, values: dict[KeyType, Any]) -> bool:
         """Dispatch event hooks."""
         # execute _event_hooks
+        handlers = self._event_hooks.get(key)
+        if not handlers:
+            return False
         flag_stop = False
-        if key in self._event_hooks:
-            for handle in self._event_hooks[key]:
-                result = handle(key, values)
-                if result is True:
-                    flag_stop = True
-                    break
+        for handle in handlers:
+            result = handle(key, values)
+            if result is True:
+                flag_stop = True
+                break
         return flag_stop
     
     def set_size(self, size: tuple[int, int]) -> None:
         """Set the window size."""
-        self.window.geometry(f"{size[0]}x{size[1]}")
+        self.window.geometry(_GEOM_SIZE_FMT % (size[0], size[1]))
         self.size = size
     
     def set_title(self, title: str) -> None:
@@ -780,30 +967,52 @@ class Window:
 
     def get_values(self) -> dict[KeyType, Any]:
         """Get values from the window."""
-        values: dict[KeyType, Any] = {}
-        for key,val in self.key_elements.items():
-            if not val.has_value:
-                continue
-            # get value from widget if possible
-            try:
-                values[key] = val.get()
-            except Exception:
-                # if not possible, return last_values
-                return self.last_values
+        cache: dict[KeyType, Any] = self.last_values
+        value_getters = self._value_getters
+        if self._values_cache_valid:
+            # elements that notify every change are served from the cache
+            # unless dirty - all other elements are re-read on each call
+            tracked = self._tracked_value_keys
+            dirty = self._dirty_keys
+            getters = [
+                (key, getter)
+                for key, getter in value_getters.items()
+                if (key not in tracked) or (key in dirty)
+            ]
+        else:
+            # full rescan
+            getters = list(value_getters.items())
+        try:
+            for key, fast_get in getters:
+                cache[key] = fast_get()
+        except Exception:
+            # a widget raised (e.g. already destroyed) - retry per key and keep last values
+            for key, fast_get in getters:
+                try:
+                    cache[key] = fast_get()
+                except Exception:
+                    pass
+        self._dirty_keys.clear()
+        self._values_cache_valid = True
         # add radio group
-        for group, vals in self.radio_group_dict.items():
-            selected = vals.get()
-            values[group] = self.radio_group_dict_keys[group][selected - 1] if selected > 0 else ""
+        for group, radio in self.radio_group_dict.items():
+            selected = radio.var.get()
+            cache[group] = radio.keys[selected - 1] if selected > 0 else ""
         # add checkbox group
         for group, check_keys in self.checkbox_dict.items():
             selected_keys = []
             for key in check_keys:
-                if values[key]:
+                if cache.get(key):
                     selected_keys.append(key)
-            values[group] = selected_keys
-        # set cache
-        self.last_values = values
-        return values
+            cache[group] = selected_keys
+        self.last_values = cache
+        # hand out a fresh dict - callers may freely mutate the result
+        return dict(cache)
+
+    def invalidate_all(self) -> None:
+        """Invalidate cached values so that the next get_values re-reads all elements."""
+        self._dirty_keys.clear()
+        self._values_cache_valid = False
 
     def _window_idle_handler(self) -> None:
         """Handle window idle event."""
@@ -814,13 +1023,15 @@ class Window:
         # set value
         if values is None:
             values = {}
+        if key in self.key_elements:
+            self._dirty_keys.add(key)
         for k, v in self.get_values().items():
             values[k] = v
         # check EG_SWAP_EVENT_NAME
         if EG_SWAP_EVENT_NAME in values:
             key = values.pop(EG_SWAP_EVENT_NAME)
         # put event
-        self.events.put((key, values))
+        self.events.append((key, values))
         _exit_mainloop()
     
     def _exit_main_loop(self) -> None:
@@ -877,6 +1088,22 @@ class Window:
         # remove from key registry
         for key in self.key_elements.keys():
             utils.remove_element_key(key)
+        # recycle tk variables (they carry no traces) @see _acquire_boolvar
+        for elem in self._elements_by_type.get("checkbox", ()):
+            var = getattr(elem, "checkbox_var", None)
+            if isinstance(var, tk.BooleanVar):
+                # snapshot the final state, then drop the reference - a later
+                # window may re-acquire this var, and a stale read must not
+                # reflect that window's state
+                try:
+                    elem._last_value = var.get()
+                except Exception:
+                    pass
+                _boolvar_pool.append(var)
+                elem.checkbox_var = None
+        for radio_group in self.radio_group_dict.values():
+            _intvar_pool.append(radio_group.var)
+        self.radio_group_dict = {}
         # close window
         try:
             self.flag_alive = False
@@ -963,27 +1190,32 @@ class Window:
         """Move window"""
         if (not self._grab_anywhere) or (not self._grab_flag):
             return
-        mouse_x = self.window.winfo_x() + event.x
-        mouse_y = self.window.winfo_y() + event.y
         sx = self._start_x if self._start_x is not None else 0
         sy = self._start_y if self._start_y is not None else 0
-        mx = self._mouse_x if self._mouse_x is not None else 0
-        my = self._mouse_y if self._mouse_y is not None else 0
-        move_x = mouse_x - mx
-        move_y = mouse_y - my
-        win_x = sx + move_x
-        win_y = sy + move_y
-        self.window.geometry(f"+{win_x}+{win_y}")
+        win_x = sx + (event.x_root - self._press_root_x)
+        win_y = sy + (event.y_root - self._press_root_y)
+        # coalesce motion events into a single geometry request per idle cycle
+        self._pending_geom = (win_x, win_y)
+        if self._geom_after_id is None:
+            self._geom_after_id = self.window.after_idle(self._flush_geom)
+
+    def _flush_geom(self) -> None:
+        """Flush the pending geometry request. @see Window._move_window"""
+        self._geom_after_id = None
+        if self._pending_geom is None:
+            return
+        win_x, win_y = self._pending_geom
+        self._pending_geom = None
+        self.window.geometry(_GEOM_LOC_FMT % (win_x, win_y))
 
     def _start_move_window(self, event: tk.Event) -> None:
         """Start move window"""
         self._grab_flag = True
-        loc = self.window.geometry().split("+")
-        self._start_x = int(loc[1])
-        self._start_y = int(loc[2])
-        self._mouse_x = self.window.winfo_x() + event.x
-        self._mouse_y = self.window.winfo_y() + event.y
-    
+        self._start_x = self.window.winfo_x()
+        self._start_y = self.window.winfo_y()
+        self._press_root_x = event.x_root
+        self._press_root_y = event.y_root
+
     def _stop_move_window(self, event: tk.Event) -> None:
         """Stop move window"""
         self._grab_flag = False
@@ -995,9 +1227,13 @@ class Window:
             return
         # bind to widget
         w: tk.Widget = element.widget
+        # partial is C-implemented - no closure cells or lambda frame per event fire
+        # (the user event key is precomputed so the handler skips a string build per fire)
+        user_key = f"{element.key}{handle_name}" if event_mode == "user" else None
         w.bind(
             event_name,
-            lambda e: _bind_event_handler(self, element, handle_name, e, propagate=propagate, event_mode=event_mode)
+            partial(_bind_event_handler, self, element, handle_name,
+                    propagate=propagate, event_mode=event_mode, user_key=user_key)
         )
 
     def _set_icon(self, icon: Union[bytes, str]) -> None:
@@ -1006,7 +1242,7 @@ class Window:
         if isinstance(icon, str): # filename str
             icon_image = get_image_tk(filename=icon) # type: ignore
         elif isinstance(icon, bytes):
-            icon_image = tk.PhotoImage(data=icon)
+            icon_image = _get_icon_image(icon)
         self._icon = icon_image
         try:
             self.window.iconphoto(False, self._icon)
@@ -1014,27 +1250,110 @@ class Window:
             print("Window.set_icon failed", file=sys.stderr)
             print(e, file=sys.stderr)
             try:
-                self.window.iconphoto(True, tk.PhotoImage(data=DEFAULT_WINDOW_ICON))
+                self.window.iconphoto(True, _get_icon_image(DEFAULT_WINDOW_ICON))
             except Exception as _:
                 pass
 
-def _bind_event_handler(win: Window, elem: "Element", handle_name: str, event: tk.Event, propagate: bool=True, event_mode: EventMode = "user") -> None:
+class _ValuesProxy(dict):
+    """
+    Lazy values dict for "system" mode bind events.
+    Element values are read from the widgets only when a key is first accessed,
+    so high-frequency events (e.g. `<Motion>`) do not walk every value element
+    per fire. Iterating over the dict materializes all remaining values, and
+    `Window.read` materializes the proxy before returning it to user code
+    (CPython's dict fast paths would silently skip pending keys otherwise).
+    """
+    def __init__(self, win: Window, base: dict) -> None:
+        super().__init__(base)
+        self._pending: dict[KeyType, Callable] = dict(win._value_getters)
+
+    def __missing__(self, key: KeyType) -> Any:
+        getter = self._pending.pop(key, None)
+        if getter is None:
+            raise KeyError(key)
+        value = self[key] = getter()
+        return value
+
+    def get(self, key: KeyType, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, key) or (key in self._pending)
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._pending)
+
+    def pop(self, key: KeyType, *default: Any) -> Any:
+        if dict.__contains__(self, key):
+            return dict.pop(self, key)
+        getter = self._pending.pop(key, None)
+        if getter is not None:
+            return getter()
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def setdefault(self, key: KeyType, default: Any = None) -> Any:
+        if dict.__contains__(self, key) or (key in self._pending):
+            return self[key] # materializes a pending key via __missing__
+        dict.__setitem__(self, key, default)
+        return default
+
+    def popitem(self) -> tuple[KeyType, Any]:
+        self._materialize()
+        return dict.popitem(self)
+
+    def __eq__(self, other: Any) -> bool:
+        self._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None # type: ignore[assignment] # dicts are unhashable anyway
+
+    def copy(self) -> dict:
+        self._materialize()
+        return dict(self)
+
+    def _materialize(self) -> None:
+        """Fetch all remaining element values."""
+        dict.update(self, {key: getter() for key, getter in self._pending.items()})
+        self._pending.clear()
+
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+def _bind_event_handler(win: Window, elem: "Element", handle_name: str, event: tk.Event, propagate: bool=True, event_mode: EventMode = "user", user_key: Union[str, None] = None) -> None:
     """Handle an event."""
     elem.user_bind_event = event # for compatibility with PySimpleGUI
     event_key: Union[str, int] = ''
     event_val: dict[Union[str, int], Any] = {}
     if event_mode == "user":
-        event_key = f"{elem.key}{handle_name}"
+        event_key = user_key if user_key is not None else f"{elem.key}{handle_name}"
         event_val = {"event": event}
-        win.events.put((event_key, event_val))
+        win.events.append((event_key, event_val))
     elif event_mode == "system":
         event_key = elem.key
-        event_val = {"event": event, "event_type": handle_name}
-        for key, key_elem in win.key_elements.items():
-            if key_elem.has_value:
-                val = key_elem.get()
-                event_val[key] = val
-        win.events.put((event_key, event_val,))
+        # collect element values lazily - only keys that are actually read pay the cost
+        event_val = _ValuesProxy(win, {"event": event, "event_type": handle_name})
+        win.events.append((event_key, event_val,))
     # propagate
     if propagate:
         # todo
@@ -1052,16 +1371,31 @@ def _exit_mainloop() -> None:
 #------------------------------------------------------------------------------
 # Element
 #------------------------------------------------------------------------------
-# for compatibility with PySimpleGUI and etc
-element_propery_alias: dict[str, str] = {
+# for compatibility with PySimpleGUI and etc (read-only - the table is fixed)
+element_propery_alias: Mapping[str, str] = MappingProxyType({
     "ButtonText": "text",
     "label": "text",
     "caption": "text",
     "justify": "text_align"
-}
+})
 
 class Element:
     """Element class."""
+    # True only for elements that mark themselves dirty on *every* value
+    # change (user input and programmatic) - @see Window.get_values
+    _notify_changes: bool = False
+    # slots for the base attributes - slot access is faster than a dict lookup
+    # (subclasses define extra attributes freely through their own __dict__)
+    __slots__ = (
+        "has_value", "key", "element_type", "ttk_style_name", "use_ttk",
+        "metadata", "style_name", "props", "widget",
+        "expand_x", "expand_y", "anchor", "has_children",
+        "prev_element", "next_element", "window", "parent",
+        "_bind_dict", "user_bind_event",
+        "vertical_alignment", "text_align", "padx", "pady",
+        "font", "has_font_prop", "col_no", "row_no", "disabled",
+        "__dict__", # subclasses and user code may still add attributes
+    )
     def __init__(
             self,
             element_type: str, # element type
@@ -1141,14 +1475,24 @@ class Element:
             values = {}
         if self.window is not None:
             self.window._event_handler(self.key, values)
-    
+
+    def _cmd_dispatch(self) -> None:
+        """Shared widget command callback (avoids a per-widget lambda)."""
+        self.disptach_event({"event_type": "command"})
+
+    def _mark_dirty(self, *args) -> None:
+        """Mark this element's value as changed in the window's values cache."""
+        win = self.window
+        if win is not None:
+            win._dirty_keys.add(self.key)
+
+    def _trace_dispatch(self, *args) -> None:
+        """Shared variable trace callback (avoids a per-widget lambda)."""
+        self.disptach_event({"event_type": "change", "event": args})
+
     def _justify_to_anchor(self, justify: TextAlign) -> str:
         """Convert justify to anchor"""
-        if justify == "left":
-            return "w"
-        if justify == "right":
-            return "e"
-        return "center"
+        return _JUSTIFY_TO_ANCHOR.get(justify, "center")
 
     def _set_pack_props(self,
             expand_x: Union[bool, None] = None,
@@ -1161,9 +1505,10 @@ class Element:
         if expand_y is not None:
             self.expand_y = expand_y
         if pad is not None:
-            if isinstance(pad, int):
+            pad_type = type(pad) # type identity is cheaper than an isinstance chain
+            if pad_type is int:
                 self.padx = self.pady = pad
-            elif isinstance(pad, tuple):
+            elif pad_type is tuple:
                 self.padx = pad[0]
                 self.pady = pad[1]
             else:
@@ -1217,47 +1562,34 @@ class Element:
             props["anchor"] = self.anchor
         return props
 
+    # property name conversion tables @see Element._convert_props
+    _RENAME_PROPS: dict[str, str] = {
+        "background_color": "bg",
+        "text_color": "fg",
+        "color": "fg",
+        "select_mode": "selectmode", # convert "select_mode" to "selectmode"
+    }
+    _ATTR_PROPS = frozenset({"expand_x", "expand_y", "padx", "pady", "anchor"})
+
     def _convert_props(self, props: dict[str, Any]) -> dict[str, Any]:
-        result = {}
-        # copy
+        """Convert element properties to tk widget options. (one pass over props)"""
+        rename_props = Element._RENAME_PROPS
+        attr_props = Element._ATTR_PROPS
+        result: dict[str, Any] = {}
         for key, val in props.items():
-            result[key] = val
-        # --- check props ---
-        # size
-        if "size" in result:
-            size = result.pop("size", (8, 1))
-            result["width"] = size[0]
-            result["height"] = size[1]
-        # background_color
-        if "background_color" in result:
-            result["bg"] = result.pop("background_color")
-        if "text_color" in result:
-            result["fg"] = result.pop("text_color")
-        if "color" in result:
-            result["fg"] = result.pop("color")
-        # expand_x
-        if "expand_x" in result:
-            self.expand_x = result.pop("expand_x")
-        if "expand_y" in result:
-            self.expand_y = result.pop("expand_y")
-        # padx / pady
-        if "padx" in result:
-            self.padx = result.pop("padx")
-        if "pady" in result:
-            self.pady = result.pop("pady")
-        # anchor
-        if "anchor" in result:
-            self.anchor = result.pop("anchor")
-        # convert "select_mode" to "selectmode"
-        if "select_mode" in result:
-            result["selectmode"] = result.pop("select_mode")
-        # user bind events
-        if "bind_events" in result:
-            bind_events = result.pop("bind_events")
-            self.bind_events(bind_events)
-        # disabled
-        if "disabled" in result:
-            result["state"] = tk.DISABLED if result.pop("disabled") else tk.NORMAL
+            if key in rename_props:
+                result[rename_props[key]] = val
+            elif key in attr_props: # pack properties (expand_x etc.)
+                setattr(self, key, val)
+            elif key == "size":
+                result["width"] = val[0]
+                result["height"] = val[1]
+            elif key == "bind_events": # user bind events
+                self.bind_events(val)
+            elif key == "disabled":
+                result["state"] = _STATE_MAP[bool(val)]
+            else:
+                result[key] = val
         return result
 
     def set_disabled(self, disabled: bool) -> None:
@@ -1265,7 +1597,7 @@ class Element:
         Set disabled widgets state
         """
         self.disabled = disabled
-        state = tk.DISABLED if disabled else tk.NORMAL
+        state = _STATE_MAP[bool(disabled)]
         self._widget_update(state=state)
 
     def bind_events(self, events: dict[str, str], event_mode: EventMode="user") -> "Element":
@@ -1274,8 +1606,12 @@ class Element:
         The specification is such that if the suffix "/hide" is attached to an event key, that event key will not be returned to the user.
         @see [Window.read](#windowread)
         """
+        bind_dict = self._bind_dict
+        win = self.window
         for event_name, handle_name in events.items():
-            self.bind(event_name, handle_name, event_mode=event_mode)
+            bind_dict[event_name] = (handle_name, True, event_mode)
+            if win is not None: # before creation the registration is deferred @see Window._create_widget
+                win.bind(self, event_name, handle_name, propagate=True, event_mode=event_mode)
         return self
 
     def create(self, win: Window, parent: tk.Widget) -> Any:
@@ -1299,35 +1635,34 @@ class Element:
                 style.element_create(style_name, "from", get_current_theme())
             except Exception as _: #ignore
                 pass
+        # collect style options and issue one configure call per style name
+        props = self.props
+        cfg: dict[str, Any] = {}
+        label_cfg: dict[str, Any] = {}
         # set font style
-        font = None
-        if "font" in self.props:
-            font = self.props.pop("font")
-            style.configure(style_name, font=font)
+        if "font" in props:
+            cfg["font"] = props.pop("font")
         # fg / bg
-        if "fg" in self.props:
-            fg = self.props.pop("fg")
-            style.configure(style_name, foreground=fg)
-            if self.ttk_style_name == "TLabelframe":
-                style.configure(f"{style_name}.Label", foreground=fg)
-        if "bg" in self.props:
-            bg = self.props.pop("bg")
-            style.configure(style_name, background=bg)
-            if self.ttk_style_name == "TLabelframe":
-                style.configure(f"{style_name}.Label", background=bg)
-        # set readonlybackground
-        if "readonlybackground" in self.props:
-            readonlybackground = self.props.pop("readonlybackground")
-            style.map(style_name, background=[("readonly", readonlybackground)])
+        if "fg" in props:
+            cfg["foreground"] = label_cfg["foreground"] = props.pop("fg")
+        if "bg" in props:
+            cfg["background"] = label_cfg["background"] = props.pop("bg")
         # check element type
         # Button ?
         if self.ttk_style_name == "TButton" or self.ttk_style_name == "TLabel":
-            if "justify" in self.props:
-                anchor = self._justify_to_anchor(self.props.pop("justify"))
-                style.configure(style_name, anchor=anchor)
-            if "height" in self.props:
-                height = self.props.pop("height")
+            if "justify" in props:
+                cfg["anchor"] = _JUSTIFY_TO_ANCHOR.get(props.pop("justify"), "center")
+            if "height" in props:
+                height = props.pop("height")
                 self.pady = (height-1)//2
+        if cfg:
+            style.configure(style_name, **cfg)
+        if label_cfg and (self.ttk_style_name == "TLabelframe"):
+            style.configure(f"{style_name}.Label", **label_cfg)
+        # set readonlybackground
+        if "readonlybackground" in props:
+            readonlybackground = props.pop("readonlybackground")
+            style.map(style_name, background=[("readonly", readonlybackground)])
     
     def _generate_style_name(self, style_key: Union[str|int, None]) -> str:
         """generate style name"""
@@ -1356,11 +1691,28 @@ class Element:
         if self.widget is not None:
             self.widget.config(cursor=cursor)
     
+    # tk options that _convert_props passes through unchanged @see Element._widget_update
+    _PLAIN_KEYS = frozenset({"text", "state", "bg", "fg", "font", "width", "height", "justify"})
+
     def _widget_update(self, **kw) -> None:
-        # update element's props
+        if not kw:
+            return
+        # drop values that match what was last applied - no-op updates skip Tk entirely
+        props = self.props
+        changed = {}
         for k, v in kw.items():
-            self.props[k] = v
-        kw = self._convert_props(kw)
+            old = props.get(k, _MISSING)
+            if (old is _MISSING) or (old != v):
+                changed[k] = v
+            elif (old is v) and isinstance(v, (list, dict)):
+                changed[k] = v # same mutable object - may have been edited in place
+        if not changed:
+            return
+        kw = changed
+        # update element's props
+        self.props.update(kw)
+        if not (kw.keys() <= Element._PLAIN_KEYS): # plain tk options need no conversion
+            kw = self._convert_props(kw)
         try:
             if (self.widget is not None)and(len(kw) > 0):
                 self.widget.configure(**kw)
@@ -1382,23 +1734,24 @@ class Element:
             return None
         return self.prev_element
 
+    # real descriptor keeps the compat name off the __getattr__ fallback path
+    Widget = property(lambda self: self.widget) # for compatibility with PySimpleGUI
+
     def __getattr__(self, name: str) -> Any:
         """Get unknown attribute."""
         # Method called when the attribute is not found in the object's instance dictionary
-        if self.widget is not None:
-            # Widget
-            if name == "Widget": # for compatibility with PySimpleGUI
-                return self.widget
+        widget = self.widget
+        if widget is not None:
             # prop
-            if hasattr(self.widget, name):
-                return self.widget.__getattribute__(name)
+            value = getattr(widget, name, _MISSING)
+            if value is not _MISSING:
+                return value
         return self.__getitem__(name)
 
     def __getitem__(self, name: str) -> Any:
         """Get element property"""
         # For compatibility with PySImpleGUI
-        if name in element_propery_alias:
-            name = element_propery_alias[name]
+        name = element_propery_alias.get(name, name)
         # check self.props
         if name in self.props:
             return self.props[name]
@@ -1433,10 +1786,14 @@ class Frame(Element):
         # other
         metadata: Union[dict[str, Any], None] = None,
         use_ttk: bool = False,
+        materialize: bool = False,  # snapshot static contents into one image (Experimental)
         **kw,
     ) -> None:
         style_name = "TLabelframe" if use_ttk else ""
         super().__init__("Frame", style_name, key, False, metadata, **kw)
+        self._materialize_on_show = materialize
+        self._materialize_label: Union[tk.Label, None] = None
+        self._materialize_packs: list[tuple[tk.Widget, dict[str, Any]]] = []
         self.has_children = True
         self.layout = layout
         self.label_outside = label_outside
@@ -1468,15 +1825,58 @@ class Frame(Element):
         """Return Widget"""
         return self.widget
 
+    def materialize(self) -> bool:
+        """
+        (Experimental) Snapshot the frame contents into one image label.
+        The live child widgets are hidden (not destroyed) so that layout
+        passes skip them; call invalidate() to restore them.
+        Only works after the window has been shown.
+        """
+        if (self.widget is None) or (self._materialize_label is not None):
+            return False
+        widget: Any = self.widget
+        try:
+            import PIL.ImageGrab  # import on demand - requires a visible window
+            widget.update_idletasks()
+            x, y = widget.winfo_rootx(), widget.winfo_rooty()
+            w, h = widget.winfo_width(), widget.winfo_height()
+            img = PIL.ImageGrab.grab(bbox=(x, y, x + w, y + h))
+        except Exception:
+            return False # screen grab unavailable (e.g. headless) - keep live widgets
+        photo = get_image_tk(data=img, size=(w, h), resize_type=ImageResizeType.NO_RESIZE)
+        if photo is None:
+            return False
+        # hide live children and show the snapshot instead
+        self._materialize_packs = []
+        for child in widget.winfo_children():
+            try:
+                self._materialize_packs.append((child, child.pack_info()))
+                child.pack_forget()
+            except Exception:
+                pass
+        label = tk.Label(widget, image=photo, borderwidth=0)
+        label.photo = photo # type: ignore # keep a reference
+        label.pack()
+        self._materialize_label = label
+        return True
+
+    def invalidate(self) -> None:
+        """Restore the live child widgets hidden by materialize()."""
+        if self._materialize_label is None:
+            return
+        self._materialize_label.destroy()
+        self._materialize_label = None
+        for child, pack_info in self._materialize_packs:
+            try:
+                child.pack(**pack_info)
+            except Exception:
+                pass
+        self._materialize_packs = []
+
     def update(self, *args, **kw) -> None:
         """Update the widget."""
         self._widget_update(**kw)
-    
-    def __getattr__(self, name):
-        """Get unknown attribute."""
-        if name in ["Widget"]:
-            return self.widget
-        return super().__getattr__(name)
+
 
 class Column(Element):
     """Frame element."""
@@ -1514,7 +1914,7 @@ class Column(Element):
         if background_color is not None:
             self.props["background_color"] = background_color
         if text_align is not None:
-            self.props["anchor"] = self._justify_to_anchor(text_align)
+            self.props["anchor"] = _JUSTIFY_TO_ANCHOR.get(text_align, "center")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         # if self.use_ttk:
@@ -1532,11 +1932,6 @@ class Column(Element):
         """Update the widget."""
         self._widget_update(**kw)
     
-    def __getattr__(self, name):
-        """Get unknown attribute."""
-        if name in ["Widget"]:
-            return self.widget
-        return super().__getattr__(name)
 
 class Tab(Element):
     """
@@ -1588,16 +1983,14 @@ class Tab(Element):
         self.has_font_prop = False
         self.use_ttk = False
         self.rows = len(layout)
-        self.cols = 0
-        for row in layout:
-            self.cols = max(self.cols, len(row))
+        self.cols = max((len(row) for row in layout), default=0)
         self._set_pack_props(expand_x=expand_x, expand_y=expand_y, pad=pad)
         if size is not None:
             self.props["size"] = size
         if background_color is not None:
             self.props["background_color"] = background_color
         if text_align is not None:
-            self.props["anchor"] = self._justify_to_anchor(text_align)
+            self.props["anchor"] = _JUSTIFY_TO_ANCHOR.get(text_align, "center")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         self.widget = tk.Frame(parent, **self.props)
@@ -1611,11 +2004,6 @@ class Tab(Element):
         """Update the widget."""
         self._widget_update(**kw)
 
-    def __getattr__(self, name):
-        """Get unknown attribute."""
-        if name in ["Widget"]:
-            return self.widget
-        return super().__getattr__(name)
 
 class TabGroup(Element):
     """
@@ -1663,9 +2051,11 @@ class TabGroup(Element):
         if layout is None:
             layout = []
         if len(layout) > 0:
-            if not isinstance(layout[0], list): # type: ignore
+            first = layout[0]
+            if type(first) is not list: # allow a flat list of Tab
                 layout = [layout] # type: ignore
-            if not isinstance(layout[0][0], Tab): # type: ignore
+                first = layout[0]
+            if not isinstance(first[0], Tab): # type: ignore
                 raise ValueError("TabGroup layout should be list of Tab")
         self.layout = layout
         if text_align is not None:
@@ -1679,7 +2069,7 @@ class TabGroup(Element):
         self.window = None
         self._set_pack_props(expand_x=expand_x, expand_y=expand_y, pad=pad)
         if text_align is not None:
-            self.props["anchor"] = self._justify_to_anchor(text_align)
+            self.props["anchor"] = _JUSTIFY_TO_ANCHOR.get(text_align, "center")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         self.window = win
@@ -1699,16 +2089,12 @@ class TabGroup(Element):
         """Update the widget."""
         self._widget_update(**kw)
 
-    def __getattr__(self, name):
-        """Get unknown attribute."""
-        if name in ["Widget"]:
-            return self.widget
-        return super().__getattr__(name)
 
 
 
 class Text(Element):
     """Text element."""
+    __slots__ = ("enable_events",)
     def __init__(
                 self,
                 text: str = "",
@@ -1742,7 +2128,7 @@ class Text(Element):
         """Create a Text widget."""
         if "justify" in self.props:
             val = self.props.pop("justify")
-            self.props["anchor"] = self._justify_to_anchor(val)
+            self.props["anchor"] = _JUSTIFY_TO_ANCHOR.get(val, "center")
             self.props["justify"] = val
         self.widget = tk.Label(parent, **self.props)
         if self.enable_events:
@@ -1758,7 +2144,9 @@ class Text(Element):
     
     def set_text(self, text: str) -> None:
         """Set the text of the widget."""
-        self.props["text"] = text
+        if self.widget is None: # before create(), props alone is enough
+            self.props["text"] = text
+            return
         self._widget_update(text=text)
 
     def update(self, text: Union[str, None] = None, *args, **kw) -> None:
@@ -1799,6 +2187,16 @@ class Label(Text):
     """
     pass
 
+def _parse_menu_label(label: str) -> tuple[str, str, bool]:
+    """Parse a menu item label into (label, key, disabled). @see Menu._add_command"""
+    disabled = label[:1] == "!"
+    if disabled:
+        label = label[1:]
+    key = label
+    if "::" in label:
+        label, key = label.split("::", 1)
+    return label, key, disabled
+
 class Menu(Element):
     """
     Menu element.
@@ -1841,44 +2239,44 @@ class Menu(Element):
             parent.add_separator()
             return
         # command
-        key = label
-        state = tk.NORMAL
-        if label.startswith("!"):
-            label = label[1:]
-            state = tk.DISABLED
-        if "::" in label:
-            label, key = label.split("::")
+        label, key, disabled = _parse_menu_label(label)
         parent.add_command(
-            label=label, 
-            state=state, # type: ignore
-            command=lambda : self.disptach_event({EG_SWAP_EVENT_NAME: key}))
+            label=label,
+            state=_STATE_MAP[bool(disabled)], # type: ignore
+            command=partial(self.disptach_event, {EG_SWAP_EVENT_NAME: key}))
 
     def _create_menu(self, parent: tk.Menu, items: list[list[Union[str, list[Any]]]], level:int = 0) -> None:
-        i = 0
-        while i < len(items):
-            item = items[i]
-            if isinstance(item, int) or isinstance(item, float):
-                item = str(item)
-            if isinstance(item, str):
-                # check next item
-                next_item = items[i+1] if i+1 < len(items) else None
-                if (next_item is None) or (not isinstance(next_item, list)):
-                    self._add_command(parent, item)
-                    i += 1
-                    continue
-                else: # if isinstance(next_item, list):
+        # iterative walker - keeps large/deep menu definitions off the Python call stack
+        tk_menu = tk.Menu # hoisted module attribute lookup
+        stack: list[tuple[tk.Menu, Any, int]] = [(parent, items, 0)]
+        while stack:
+            parent, items, i = stack.pop()
+            n = len(items)
+            while i < n:
+                item = items[i]
+                if isinstance(item, (int, float)):
+                    item = str(item)
+                if isinstance(item, str):
+                    # check next item
+                    next_item = items[i+1] if i+1 < n else None
+                    if type(next_item) is not list: # identity check - no MRO walk
+                        self._add_command(parent, item)
+                        i += 1
+                        continue
                     # submenu
-                    submenu = tk.Menu(parent, tearoff=False)
+                    submenu = tk_menu(parent, tearoff=False)
                     parent.add_cascade(label=item, menu=submenu)
-                    self._create_menu(submenu, next_item, level+1)
-                    i += 2
+                    stack.append((parent, items, i + 2)) # resume here afterwards
+                    parent, items, i = submenu, next_item, 0
+                    n = len(items)
                     continue
-            if isinstance(item, list):
-                self._create_menu(parent=parent, items=item, level=level+1) # type: ignore
+                if type(item) is list:
+                    stack.append((parent, items, i + 1)) # resume here afterwards
+                    items, i = item, 0
+                    n = len(items)
+                    continue
+                # others
                 i += 1
-                continue
-            # others
-            i += 1
 
     def get(self) -> Any:
         """Get the value of the widget."""
@@ -1889,7 +2287,9 @@ class Menu(Element):
     
     def set_text(self, text: str) -> None:
         """Set the text of the widget."""
-        self.props["text"] = text
+        if self.widget is None: # before create(), props alone is enough
+            self.props["text"] = text
+            return
         self._widget_update(text=text)
 
     def update(self, menu_definition: Union[list[list[Union[str, list[Any]]]], None] = None, *args, **kw) -> None:
@@ -1918,6 +2318,7 @@ class Button(Element):
                     break
         ```
     """
+    __slots__ = ("tooltip",)
     def __init__(
         self,
         button_text: str = "Button",
@@ -1954,23 +2355,21 @@ class Button(Element):
         if button_color is not None:
             self.set_button_color(button_color, update=False)
         self._set_text_props(font=font, text_align=text_align, color=color, text_color=text_color, background_color=background_color)
-        self._set_pack_props(expand_x=expand_x, expand_y=expand_y, pad=pad)
-        self.bind_events({
-            "<Button-3>": "right_click",
-            "<Return>": "return",
-        }, "system")
+        if expand_x or expand_y or (pad is not None): # all-default packing needs no props
+            self._set_pack_props(expand_x=expand_x, expand_y=expand_y, pad=pad)
+        self.bind_events(_BUTTON_BINDS, "system")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         """Create a Button widget."""
         if self.use_ttk:
             self.widget = ttk.Button(
                 parent,
-                command=lambda: self.disptach_event({"event_type": "command"}),
+                command=self._cmd_dispatch,
                 **self.props)
         else:
             self.widget = tk.Button(
                 parent,
-                command=lambda: self.disptach_event({"event_type": "command"}),
+                command=self._cmd_dispatch,
                 **self.props)
         return self.widget
 
@@ -1986,7 +2385,10 @@ class Button(Element):
         else:
             props["background_color"] = button_color
         if update:
-            self._widget_update(**props)
+            if self.widget is None: # before create(), props alone is enough
+                self.props.update(props)
+            else:
+                self._widget_update(**props)
 
     def get(self) -> Any:
         """Returns the text of the button.."""
@@ -1994,7 +2396,9 @@ class Button(Element):
     
     def set_text(self, text: str) -> None:
         """Set the text of the button."""
-        self.props["text"] = text
+        if self.widget is None: # before create(), props alone is enough
+            self.props["text"] = text
+            return
         self._widget_update(text=text)
     
     def get_text(self) -> str:
@@ -2008,8 +2412,7 @@ class Button(Element):
                **kw) -> None:
         """Update the widget."""
         if text is not None:
-            self.props["text"] = text
-            self._widget_update(text=text)
+            self.set_text(text)
         if disabled is not None:
             self.set_disabled(disabled)
         if button_color is not None:
@@ -2017,17 +2420,17 @@ class Button(Element):
         # other
         self._widget_update(**kw)
     
-    def __getattr__(self, name: str) -> Any:
-        """Get unknown attribute. """
-        # Get the text of the button. (compatibility with PySimpleGUI)
-        if name == "GetText":
-            return self.get_text
-        elif name == "ButtonText":
-            return self.get_text()
-        return super().__getattr__(name)
+    # PySimpleGUI compatibility aliases - resolved on the class without a __getattr__ hop
+    GetText = get_text
+
+    @property
+    def ButtonText(self) -> str:
+        """Get the text of the button. (compatibility with PySimpleGUI)"""
+        return self.get_text()
 
 class CloseButton(Button):
     """CloseButton element."""
+    __slots__ = () # no attributes beyond the base class
     def __init__(
         self,
         button_text: str = "Close",
@@ -2058,6 +2461,8 @@ class Submit(Button):
 
 class Checkbox(Element):
     """Checkbox element."""
+    __slots__ = ("_last_value", "checkbox_var", "default_value", "group_id")
+    _notify_changes = True # _on_change (click) and set_value both mark dirty
     def __init__(
                 self, text: str="",
                 default: bool=False,
@@ -2072,11 +2477,11 @@ class Checkbox(Element):
         super().__init__("Checkbox", "TCheckbutton", key, True, metadata, **kw)
         self.use_ttk = True
         self.default_value = default
+        self.checkbox_var: Union[tk.BooleanVar, None] = None
+        self._last_value: bool = default # reported after the window closes
         self.props["text"] = text
         if enable_events:
-            self.bind_events({
-                "<Button-3>": "right_click"
-            }, "system")
+            self.bind_events(_RIGHT_CLICK_BINDS, "system")
         self.group_id = group_id
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
@@ -2086,7 +2491,7 @@ class Checkbox(Element):
                 win.checkbox_dict[self.group_id] = []
             win.checkbox_dict[self.group_id].append(str(self.key))
         # create checkbox
-        self.checkbox_var = tk.BooleanVar(value=self.default_value)
+        self.checkbox_var = _acquire_boolvar(self.default_value)
         # self.checkbox_var.trace_add("write", lambda *args: self.disptach_event({"event_type": "change", "event": args}))
         # self.checkbox_var.trace_add("write", self._on_change)
         self.widget = ttk.Checkbutton(
@@ -2101,6 +2506,7 @@ class Checkbox(Element):
     def _on_change(self) -> None:
         """Change event."""
         if self.window is not None:
+            self.window._dirty_keys.add(self.key)
             values: dict[KeyType, Any] = self.window.get_values()
             values["event_type"] = "change"
             values["event"] = self.checkbox_var.get()
@@ -2108,10 +2514,15 @@ class Checkbox(Element):
     
     def get_value(self) -> Any:
         """Get the value of the widget."""
+        if self.checkbox_var is None: # window closed - return the last state
+            return self._last_value
         return self.checkbox_var.get()
 
     def set_value(self, b: bool) -> None:
         """Set the value of the widget."""
+        if self.checkbox_var is None: # window closed - nothing to set
+            return
+        self._mark_dirty()
         self.checkbox_var.set(b)
 
     def get(self) -> Any:
@@ -2120,7 +2531,9 @@ class Checkbox(Element):
 
     def set_text(self, text: str) -> None:
         """Set the text of the widget."""
-        self.props["text"] = text
+        if self.widget is None: # before create(), props alone is enough
+            self.props["text"] = text
+            return
         self._widget_update(text=text)
 
     def update(self, *args, **kw) -> None:
@@ -2137,6 +2550,7 @@ class Checkbox(Element):
 
 class Radio(Element):
     """Checkbox element."""
+    __slots__ = ("created_radio", "default_value", "group_id", "text", "value")
     def __init__(
                 self,
                 text: str = "",
@@ -2158,35 +2572,21 @@ class Radio(Element):
         self.group_id: str = str(group_id)
         self.created_radio = False
         if enable_events:
-            self.bind_events({
-                "<Button-3>": "right_click"
-            }, "system")
+            self.bind_events(_RIGHT_CLICK_BINDS, "system")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
-        # post change event
-        def post_change_event(*args) -> None:
-            if not self.created_radio:
-                return
-            selected_key: KeyType = self.key if self.key else self.text
-            values = win.get_values()
-            for k in values.keys():
-                if values[k] is True:
-                    selected_key = k
-            values['event_type'] = "change"
-            win.post_event(selected_key, values)
         # create radio group
         key: str = str(self.key) if self.key else self.text
-        if self.group_id not in win.radio_group_dict:
-            win.radio_group_dict[self.group_id] = tk.IntVar(value=0)
-            win.radio_group_dict_keys[self.group_id] = [key]
-        else:
-            win.radio_group_dict_keys[self.group_id].append(key)
-        self.value = len(win.radio_group_dict_keys[self.group_id])
+        group = win.radio_group_dict.get(self.group_id)
+        if group is None:
+            group = win.radio_group_dict[self.group_id] = _RadioGroup(_acquire_intvar(0))
+        group.keys.append(key)
+        self.value = len(group.keys)
         # create radiobutton
         self.widget = ttk.Radiobutton(
             parent,
             value=self.value,
-            variable=win.radio_group_dict[self.group_id],
+            variable=group.var,
             style=self.style_name,
             command=self._on_change,
             **self.props)
@@ -2198,6 +2598,7 @@ class Radio(Element):
     def _on_change(self) -> None:
         """Change event."""
         if self.window is not None:
+            self.window._dirty_keys.add(self.key)
             values: dict[KeyType, Any] = self.window.get_values()
             values["event_type"] = "change"
             values["radio.index"] = self.get_value()
@@ -2207,13 +2608,19 @@ class Radio(Element):
         """Select the radio button."""
         if self.window is None:
             return
-        self.window.radio_group_dict[self.group_id].set(self.value)
-    
+        group = self.window.radio_group_dict.get(self.group_id)
+        if group is None: # window closed - the group var was donated to the pool
+            return
+        group.var.set(self.value)
+
     def is_selected(self) -> bool:
         """Check if the radio button is selected."""
         if self.window is None:
             return False
-        return self.window.radio_group_dict[self.group_id].get() == self.value
+        group = self.window.radio_group_dict.get(self.group_id)
+        if group is None: # window closed - the group var was donated to the pool
+            return False
+        return group.var.get() == self.value
 
     def get_value(self) -> int:
         """This method returns the id of an element within a group."""
@@ -2225,7 +2632,9 @@ class Radio(Element):
 
     def set_text(self, text: str) -> None:
         """Set the text of the widget."""
-        self.props["text"] = text
+        if self.widget is None: # before create(), props alone is enough
+            self.props["text"] = text
+            return
         self._widget_update(text=text)
 
     def update(self, text: Union[str, None] = None, **kw) -> None:
@@ -2238,6 +2647,8 @@ class Input(Element):
     """
     Text input element.
     """
+    __slots__ = ("default_text", "enable_events", "readonly", "text_var")
+    _notify_changes = True # the text_var write trace marks every change
     def __init__(
                 self,
                 text: str = "", # default text
@@ -2272,7 +2683,6 @@ class Input(Element):
         if default_text is not None: # compatibility with PySimpleGUI
             text = default_text
         self.default_text = text # default text @see Input.create
-        self._set_text_props(font=font, text_align=text_align, color=color, text_color=text_color, background_color=background_color)
         if readonly_background_color is not None:
             self.props["readonlybackground"] = readonly_background_color
         if password_char is not None:
@@ -2283,32 +2693,20 @@ class Input(Element):
             self.props["size"] = (width, 1)
         # set props
         self._set_text_props(font=font, text_align=text_align, color=color, text_color=text_color, background_color=background_color)
-        self._set_pack_props(expand_x=expand_x, expand_y=expand_y, pad=pad)
+        if expand_x or expand_y or (pad is not None): # all-default packing needs no props
+            self._set_pack_props(expand_x=expand_x, expand_y=expand_y, pad=pad)
         if enable_events:
-            self.bind_events({
-                "<Return>": "return",
-            }, "system")
+            self.bind_events(_RETURN_BINDS, "system")
         if enable_key_events:
-            self.bind_events({
-                "<Key>": "key",
-            }, "system")
+            self.bind_events(_KEY_BINDS, "system")
         if enable_focus_events:
-            self.bind_events({
-                "<FocusIn>": "focusin",
-                "<FocusOut>": "focusout",
-                "<Button-1>": "click",
-                "<Button-3>": "right_click"
-            }, "system")
+            self.bind_events(_FOCUS_BINDS, "system")
     
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         """create Input widget"""
-        # check props
-        # if "height" in self.props:
-        #     self.props.pop("height") # no property
         # set default text
         self.text_var = tk.StringVar(value=self.default_text)
-        if "height" in self.props:
-            self.props.pop("height")
+        self.props.pop("height", None) # tk.Entry has no height option
         # create
         self.widget = tk.Entry(
             parent,
@@ -2318,10 +2716,10 @@ class Input(Element):
         # set readonly
         if self.readonly:
             self.set_readonly(self.readonly)
-        # trace change
+        # trace change - typing and programmatic writes both go through the var
+        self.text_var.trace_add("write", self._mark_dirty)
         if self.enable_events:
-            self.text_var.trace_add("write",
-                lambda *args: self.disptach_event({"event_type": "change", "event": args}))
+            self.text_var.trace_add("write", self._trace_dispatch)
         return self.widget
 
     def get(self) -> Any:
@@ -2360,6 +2758,8 @@ class Input(Element):
     def set_readonly(self, readonly: bool) -> None:
         """set readonly"""
         self.readonly = readonly
+        if self.widget is None: # create() applies self.readonly later
+            return
         state = "readonly" if self.readonly else "normal"
         self._widget_update(state=state)
 
@@ -2408,11 +2808,10 @@ class Input(Element):
         """delete selected text"""
         if self.widget is None:
             return ""
-        try:
-            text = self.get_selected_text()
-            self.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
-        except Exception as _:
+        if not self.widget.selection_present(): # no selection is the common case
             return ""
+        text = self.get_selected_text()
+        self.widget.delete(_TK_SEL_FIRST, _TK_SEL_LAST)
         return text
 
     def paste(self):
@@ -2421,30 +2820,28 @@ class Input(Element):
             return
         # delete selected
         self.delete_selected()
-        # insert
-        text = utils.get_clipboard()
-        input: tk.Entry = self.widget # type: ignore
-        current_cursor_position = input.index(tk.INSERT)
-        input.insert(current_cursor_position, text)
+        # insert - read the clipboard through tk itself, no external helper
+        try:
+            text = self.widget.clipboard_get()
+        except Exception as _: # clipboard empty or not text
+            return
+        self.widget.insert(_TK_INSERT, text)
     
     def get_selection_pos(self) -> tuple[int, int]:
         """get selection positions"""
         if self.widget is None:
             return (0, 0)
-        try:
-            entry: tk.Entry = self.widget
-            start_pos = entry.index(tk.SEL_FIRST)
-            end_pos = entry.index(tk.SEL_LAST)
-            return start_pos, end_pos
-        except Exception as _:
-            cur = self.get_cursor_pos()
-            return (cur, cur)
+        entry: tk.Entry = self.widget
+        if entry.selection_present():
+            return entry.index(_TK_SEL_FIRST), entry.index(_TK_SEL_LAST)
+        cur = self.get_cursor_pos()
+        return (cur, cur)
     
     def get_cursor_pos(self) -> int:
         """get cursor position"""
         if self.widget is None:
             return 0
-        cursor_pos = self.widget.index(tk.INSERT)
+        cursor_pos = self.widget.index(_TK_INSERT)
         return cursor_pos
 
     def set_cursor_pos(self, index: int) -> None:
@@ -2457,24 +2854,19 @@ class Input(Element):
         """get selection start"""
         if self.widget is None:
             return 0
-        try:
-            entry: tk.Entry = self.widget
-            start_pos = entry.index(tk.SEL_FIRST)
-            return start_pos
-        except Exception as _:
-            return self.get_cursor_pos()
+        entry: tk.Entry = self.widget
+        if entry.selection_present():
+            return entry.index(_TK_SEL_FIRST)
+        return self.get_cursor_pos()
 
     def get_selection_length(self) -> int:
         """get selection length"""
         if self.widget is None:
             return 0
-        try:
-            entry: tk.Entry = self.widget
-            start_pos = entry.index(tk.SEL_FIRST)
-            end_pos = entry.index(tk.SEL_LAST)
-            return end_pos - start_pos
-        except Exception as _:
+        entry: tk.Entry = self.widget
+        if not entry.selection_present():
             return 0
+        return entry.index(_TK_SEL_LAST) - entry.index(_TK_SEL_FIRST)
     
     def set_selection_start(self, sel_start: int, sel_length: int=0) -> None:
         """set selection start and length"""
@@ -2493,6 +2885,7 @@ class InputText(Input):
 
 class Multiline(Element):
     """Multiline text input element."""
+    __slots__ = ("_scroll_pending", "_tag_cache", "autoscroll", "readonly", "readonly_background_color")
     def __init__(
         self,
         text: str = "",  # default text
@@ -2525,7 +2918,8 @@ class Multiline(Element):
         self.props["text"] = text
         self.props["size"] = size
         self._set_text_props(font=font, color=color, text_color=text_color, background_color=background_color)
-        self._set_pack_props(expand_x=expand_x, expand_y=expand_y, pad=pad)
+        if expand_x or expand_y or (pad is not None): # all-default packing needs no props
+            self._set_pack_props(expand_x=expand_x, expand_y=expand_y, pad=pad)
         if text_align is not None:
             self.text_align = text_align
         if readonly_background_color is not None:
@@ -2533,22 +2927,15 @@ class Multiline(Element):
         self.has_value = True
         self.readonly = readonly
         self.autoscroll = autoscroll
+        self._scroll_pending = False
+        self._tag_cache: dict[tuple[Union[str, None], Union[str, None]], list[str]] = {}
         # bind events
         if enable_events:
-            self.bind_events({
-                "<Return>": "return",
-            }, "system")
+            self.bind_events(_RETURN_BINDS, "system")
         if enable_key_events:
-            self.bind_events({
-                "<Key>": "key",
-            }, "system")
+            self.bind_events(_KEY_BINDS, "system")
         if enable_focus_events:
-            self.bind_events({
-                "<FocusIn>": "focusin",
-                "<FocusOut>": "focusout",
-                "<Button-1>": "click",
-                "<Button-3>": "right_click"
-            }, "system")
+            self.bind_events(_FOCUS_BINDS, "system")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         """Create a Multiline widget."""
@@ -2578,8 +2965,9 @@ class Multiline(Element):
     def _hook_return_event_for_text_align(self, event, values) -> None:
         """Hook Return key event for text_align."""
         if event == f"{self.key}--text_align_return/hide": # @see Multiline.create > event_hook
-            text = self.get_text()
-            self.set_text(text)
+            if (self.widget is not None) and (self.text_align is not None):
+                # re-tag the buffer in place - no full get/set roundtrip
+                self.widget.tag_add(self.text_align, "1.0", "end")
 
     def get(self) -> Any:
         """Get the value of the widget."""
@@ -2616,19 +3004,22 @@ class Multiline(Element):
         """Paste the text."""
         if self.widget is None:
             return
-        text = utils.get_clipboard()
-        self.widget.insert(tk.INSERT, text)
-        self.widget.tag_remove(tk.SEL, '1.0', tk.END) 
-        self.widget.see(tk.INSERT)
+        try:
+            text = self.widget.clipboard_get() # tk-native clipboard read
+        except Exception as _: # clipboard empty or not text
+            return
+        self.widget.insert(_TK_INSERT, text)
+        self.widget.tag_remove(_TK_SEL, '1.0', _TK_END)
+        self.widget.see(_TK_INSERT)
 
     def cut(self) -> str:
         """Cut the selected text."""
         if self.widget is None:
             return
         text = ""
-        if self.widget.tag_ranges(tk.SEL):
+        if self.widget.tag_ranges(_TK_SEL):
             text = self.copy()
-            self.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
+            self.widget.delete(_TK_SEL_FIRST, _TK_SEL_LAST)
         return text
 
     def update(
@@ -2650,39 +3041,44 @@ class Multiline(Element):
     def set_readonly(self, readonly: bool) -> None:
         """Set readonly"""
         self.readonly = readonly
-        state = tk.DISABLED if readonly else tk.NORMAL
+        if self.widget is None: # create() applies self.readonly later
+            return
+        state = _STATE_MAP[bool(readonly)]
         self._widget_update(state=state)
 
     def set_text(self, text: str) -> None:
         """Set text"""
-        if self.widget is None:
+        widget = self.widget
+        if widget is None:
             return
-        if self.readonly:
-            self._widget_update(state=tk.NORMAL)
         self.props["text"] = text
-        # clear text
-        self.widget.delete("1.0", "end") # clear text
-        # set text
+        # issue the whole update as direct Tcl calls - set_text runs per line in
+        # logging panes, and the tkinter wrappers add a Python layer per command
+        # (readonly toggling stays out of self.props: it ends where it started)
+        tcl = widget.tk
+        path = widget._w # type: ignore # widget path name
+        if self.readonly:
+            tcl.call(path, "configure", "-state", "normal")
+        tcl.call(path, "delete", "1.0", "end") # clear text
         if self.text_align is not None:
-           self.widget.insert("1.0", text, self.text_align)
+            tcl.call(path, "insert", "1.0", text, self.text_align)
         else:
-            self.widget.insert("1.0", text)
+            tcl.call(path, "insert", "1.0", text)
         if self.readonly:
-            self._widget_update(state=tk.DISABLED)
+            tcl.call(path, "configure", "-state", "disabled")
         # autoscroll ?
         if self.autoscroll:
-            self.widget.see(tk.END)
+            tcl.call(path, "see", "end")
     
     def get_selection_pos(self) -> tuple[str, str]:
         """Get selection position, returns (start_pos, end_pos)."""
         if self.widget is None:
             return ("", "")
-        try:
-            sel_start, sel_end = self.widget.tag_ranges("sel")
-            return (sel_start, sel_end) # type: ignore
-        except Exception as _:
-            pos = self.get_cursor_pos()
-            return (pos, pos)
+        ranges = self.widget.tag_ranges("sel") # empty tuple when nothing is selected
+        if ranges:
+            return (ranges[0], ranges[1]) # type: ignore
+        pos = self.get_cursor_pos()
+        return (pos, pos)
 
     def set_selection_pos(self, start_pos: str, end_pos: str) -> None:
         """Set selection position."""
@@ -2697,35 +3093,53 @@ class Multiline(Element):
 
     def pos_to_index(self, pos: str) -> int:
         """Convert position to index."""
+        if self.widget is not None:
+            # let tk's text storage count characters - no full-buffer copy or split
+            count = self.widget.count("1.0", pos, "chars")
+            return int(count[0]) if count else 0
         row_s, col_s = pos.split(".")
         row, col = int(row_s), int(col_s)
         text = self.get_text()
         retcode = "\r\n" if "\r\n" in text else "\n"
         retcode_len = len(retcode)
+        # walk line breaks with find() - no per-line list allocation
         start = 0
-        for i, line in enumerate(text.split("\n")):
-            if (row - 1) == i:
-                start += col
-                break
-            start += len(line) + retcode_len
-        return start
+        scan = 0
+        for _ in range(row - 1):
+            nl = text.find("\n", scan)
+            if nl < 0: # row is past the last line
+                return start + (len(text) - scan) + retcode_len
+            start += (nl - scan) + retcode_len
+            scan = nl + 1
+        return start + col
 
     def index_to_pos(self, index: int) -> str:
         """Convert index to postion."""
+        if self.widget is not None:
+            # tk resolves the index against its own line table
+            return str(self.widget.index(f"1.0 + {index} chars"))
         text = self.get_text()
         retcode = "\r\n" if "\r\n" in text else "\n"
         retcode_len = len(retcode)
+        # walk line breaks with find() - no per-line list allocation
         row = 1
         col = 0
         start = 0
-        for line_no, line in enumerate(text.split("\n")):
-            line_start = start
-            line_end = line_start + len(line) + retcode_len
-            start = line_end
+        scan = 0
+        line_no = 0
+        while True:
+            nl = text.find("\n", scan)
+            line_len = (nl - scan) if nl >= 0 else (len(text) - scan)
+            line_end = start + line_len + retcode_len
             if index < line_end:
                 row = line_no + 1
-                col = index - line_start
+                col = index - start
                 break
+            if nl < 0: # index is past the last line
+                break
+            start = line_end
+            scan = nl + 1
+            line_no += 1
         return f"{row}.{col}"
 
     def get_cursor_pos(self) -> str:
@@ -2742,21 +3156,20 @@ class Multiline(Element):
         """Set cursor position. (like `3.0`, row=3, col=0)"""
         if self.widget is None:
             return
-        self.widget.mark_set(tk.INSERT, pos)
+        self.widget.mark_set(_TK_INSERT, pos)
 
     def get_selection_start(self) -> int:
         """get selection start"""
         if self.widget is None:
             return 0
+        ranges = self.widget.tag_ranges("sel")
+        if ranges:
+            return int(self.pos_to_index(ranges[0])) # type: ignore
+        pos = self.get_cursor_pos()
         try:
-            sel_start, _ = self.widget.tag_ranges("sel")
-            return int(self.pos_to_index(sel_start)) # type: ignore
-        except Exception as _:
-            pos = self.get_cursor_pos()
-            try:
-                return int(self.pos_to_index(pos))
-            except ValueError as _:
-                return 0
+            return int(self.pos_to_index(pos))
+        except ValueError as _:
+            return 0
 
     def set_selection_start(self, index: int, sel_length: int=0) -> None:
         """set selection start"""
@@ -2782,27 +3195,46 @@ class Multiline(Element):
         if self.widget is None:
             return
         text: tk.Text = self.widget
-        text.tag_add(tk.SEL, "1.0", tk.END)
-        text.mark_set(tk.INSERT, '1.0')
-        self.widget.see(tk.INSERT)
+        text.tag_add(_TK_SEL, "1.0", _TK_END)
+        text.mark_set(_TK_INSERT, '1.0')
+        self.widget.see(_TK_INSERT)
 
     def print(self, text: str, text_color: Union[str, None] = None, background_color: Union[str, None] = None, end:str="\n", autoscroll: bool = False) -> None:
         """Print text."""
         text += end
         if self.widget is None:
             return
-        tags: list[str] = []
-        if text_color is not None:
-            tag = generate_element_style_key("--multiline-text_color")
-            self.widget.tag_config(tag, foreground=text_color)
-            tags.append(tag)
-        if background_color is not None:
-            tag = generate_element_style_key("--multiline-background_color")
-            self.widget.tag_config(tag, background=background_color)
-            tags.append(tag)
-        self.widget.insert("end", text, tags)
-        if self.autoscroll or autoscroll:
-            self.widget.see(tk.END)
+        if (text_color is None) and (background_color is None):
+            # fast pass-through for uncolored text - no tag machinery at all
+            self.widget.insert("end", text)
+        else:
+            # reuse tags per color pair - repeated prints skip the tag_config round-trip
+            tags: list[str] = []
+            cache_key = (text_color, background_color)
+            cached = self._tag_cache.get(cache_key)
+            if cached is None:
+                if text_color is not None:
+                    tag = generate_element_style_key("--multiline-text_color")
+                    self.widget.tag_config(tag, foreground=text_color)
+                    tags.append(tag)
+                if background_color is not None:
+                    tag = generate_element_style_key("--multiline-background_color")
+                    self.widget.tag_config(tag, background=background_color)
+                    tags.append(tag)
+                self._tag_cache[cache_key] = tags
+            else:
+                tags = cached
+            self.widget.insert("end", text, tags)
+        if (self.autoscroll or autoscroll) and (not self._scroll_pending):
+            # scroll once per idle turn, not once per print
+            self._scroll_pending = True
+            self.widget.after_idle(self._do_autoscroll)
+
+    def _do_autoscroll(self) -> None:
+        """Perform one deferred autoscroll."""
+        self._scroll_pending = False
+        if self.widget is not None:
+            self.widget.see(_TK_END)
 
 class Textarea(Multiline):
     """Textarea element. (alias of Multiline)"""
@@ -2858,10 +3290,10 @@ class Slider(Element):
             self.props["showvalue"] = 0 # hide number
         # events
         self.enable_events = enable_events
+        self._dispatch_interval_ms: int = 50 # coalesce drag events to about 20/sec
+        self._pending_event: Union[tuple, None] = None
         if enable_changed_events:
-            self.bind_events({
-                "<ButtonRelease-1>": "release"
-            }, "system")
+            self.bind_events(_RELEASE_BINDS, "system")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         """Create the widget."""
@@ -2876,29 +3308,45 @@ class Slider(Element):
                 length = size[1] * win.font_size_average[1]
             self.props["width"] = width
             self.props["length"] = length
-        # var
-        self.scale_var = tk.DoubleVar()
-        self.scale_var.set(self.default_value)
-        # command
+        # var - display-only sliders skip the Tcl variable and read the widget directly
+        self.scale_var: Union[tk.DoubleVar, None] = None
+        if self.enable_events:
+            self.scale_var = tk.DoubleVar()
+            self.scale_var.set(self.default_value)
+        # command - Tk fires per pixel while dragging, so coalesce via after()
         command: Union[str, Callable] = ''
         def on_command(*event):
-            self.disptach_event({"event_type": "change", "event": event})
+            first = self._pending_event is None
+            self._pending_event = event
+            if first:
+                self.widget.after(self._dispatch_interval_ms, self._flush_change_event)
         if self.enable_events:
             command = on_command
         # widget
-        self.widget = tk.Scale(
-            parent,
-            from_=self.range[0],
-            to=self.range[1],
-            resolution=self.resolution,
-            command=command,
-            variable=self.scale_var,
-            **self.props)
+        opts: dict[str, Any] = {
+            "from_": self.range[0],
+            "to": self.range[1],
+            "resolution": self.resolution,
+            "command": command,
+        }
+        if self.scale_var is not None:
+            opts["variable"] = self.scale_var
+        self.widget = tk.Scale(parent, **opts, **self.props)
+        if (self.scale_var is None) and (self.default_value != self.range[0]):
+            self.widget.set(self.default_value)
         return self.widget
 
+    def _flush_change_event(self) -> None:
+        """Dispatch the latest coalesced change event."""
+        event, self._pending_event = self._pending_event, None
+        if event is not None:
+            self.disptach_event({"event_type": "change", "event": event})
+
     def get(self) -> Any:
         """Return slider value."""
-        return self.scale_var.get()
+        if self.scale_var is not None:
+            return self.scale_var.get()
+        return self.widget.get()  # type: ignore
     
     def set(self, value: float) -> None:
         """Set value of Slider"""
@@ -2906,10 +3354,12 @@ class Slider(Element):
 
     def set_range(self, from_: float, to: float) -> None:
         """Set the range of the slider."""
+        self.range = (from_, to)
         self.widget.config(from_=from_, to=to)  # type: ignore
 
     def get_range(self) -> tuple[float, float]:
-        return (self.widget.cget("from"), self.widget.cget("to"))  # type: ignore
+        # self.range is authoritative - no cget round-trips
+        return (self.range[0], self.range[1])
 
     def update(
         self,
@@ -2940,25 +3390,45 @@ class Canvas(Element):
                 enable_events: bool = False,
                 background_color: Union[str, None] = None,
                 size: tuple[int, int] = (300, 300),
+                motion_throttle_ms: int = 16, # coalesce mousemove events per interval
                 # other
                 metadata: Union[dict[str, Any], None] = None,
                 **kw) -> None:
         super().__init__("Canvas", "", key, False, metadata, **kw)
         self.props["size"] = size
         self.has_font_prop = False
+        self._motion_events = enable_events
+        self._motion_throttle_ms = motion_throttle_ms
+        self._pending_motion: Union[tk.Event, None] = None
         if background_color:
             self.props["background"] = background_color
         if enable_events:
-            self.bind_events({
-                "<ButtonPress>": "mousedown",
-                "<ButtonRelease>": "mouseup",
-                "<Motion>": "mousemove"
-            }, "system")
+            self.bind_events(_MOUSE_BINDS, "system")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         self.widget = tk.Canvas(parent, **self.props)
+        if self._motion_events:
+            # Motion fires per pixel - coalesce instead of binding it as a system event
+            self.widget.bind("<Motion>", self._on_motion)
         return self.widget
-    
+
+    def _on_motion(self, event: tk.Event) -> None:
+        """Store the latest Motion event and schedule one dispatch."""
+        first = self._pending_motion is None
+        self._pending_motion = event
+        if first:
+            self.widget.after(self._motion_throttle_ms, self._flush_motion)
+
+    def _flush_motion(self) -> None:
+        """Dispatch the latest coalesced mousemove event."""
+        event, self._pending_motion = self._pending_motion, None
+        if (event is None) or (self.window is None):
+            return
+        self.user_bind_event = event # for compatibility with PySimpleGUI
+        win = self.window
+        win.events.append((self.key, _ValuesProxy(win, {"event": event, "event_type": "mousemove"})))
+
+
     def clear(self) -> None:
         """Clear the canvas."""
         self.widget.delete("all")  # type: ignore
@@ -2971,14 +3441,15 @@ class Canvas(Element):
         """Update the widget."""
         self._widget_update(**kw)
     
-    def __getattr__(self, name):
-        """Get unknown attribute."""
-        if name in ["Widget", "tk_canvas", "TKCanvas"]: # compatibility with PySimpleGUI
-            return self.widget
-        return super().__getattr__(name)
+    # @see Element.Widget (compatibility with PySimpleGUI)
+    tk_canvas = property(lambda self: self.widget)
+    TKCanvas = property(lambda self: self.widget)
 
 class Graph(Element):
     """Graph element."""
+    # @see Element.Widget (compatibility with PySimpleGUI)
+    tk_canvas = property(lambda self: self.widget)
+    TKCanvas = property(lambda self: self.widget)
     def __init__(
             self, key: Union[str, None] = None,
             background_color: Union[str, None] = None,
@@ -3003,6 +3474,7 @@ class Graph(Element):
         if background_color:
             self.props["background"] = background_color
         self.parent_window: Window|None = None
+        self._batch: Union[list, None] = None # queued primitives (@see begin_batch)
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         self.widget: tk.Canvas = tk.Canvas(parent, **self.props)
@@ -3016,15 +3488,38 @@ class Graph(Element):
     def update(self, *args, **kw) -> None:
         """Update the widget."""
         self._widget_update(**kw)
-    
-    def __getattr__(self, name):
-        """Get unknown attribute."""
-        if name in ["Widget"]:
-            return self.widget
-        return super().__getattr__(name)
-    
+
+    def begin_batch(self) -> None:
+        """Start queueing draw_line/draw_point calls. Flush with end_batch()."""
+        self._batch = []
+
+    def end_batch(self) -> None:
+        """Flush queued primitives, merging runs of the same style into one create_* call."""
+        batch, self._batch = self._batch, None
+        if not batch:
+            return
+        widget = self.widget
+        for kind, style, points in batch:
+            if kind == "line":
+                widget.create_line(points, fill=style[0], width=style[1])  # type: ignore
+            else: # point
+                size2 = style[1] / 2
+                create_oval = widget.create_oval  # type: ignore
+                for x, y in points:
+                    create_oval(x-size2, y-size2, x+size2, y+size2, fill=style[0])
+
     def draw_line(self, point_from: PointType, point_to: PointType, color: str = 'black', width: int = 1) -> int:
-        """Draw a line."""
+        """Draw a line. (batched draws return 0 instead of an item id)"""
+        if self._batch is not None:
+            style = (color, width)
+            if self._batch:
+                kind, last_style, points = self._batch[-1]
+                # extend the last polyline when style matches and the segments connect
+                if (kind == "line") and (last_style == style) and (points[-1] == point_from):
+                    points.append(point_to)
+                    return 0
+            self._batch.append(("line", style, [point_from, point_to]))
+            return 0
         return self.widget.create_line(point_from, point_to, fill=color, width=width)  # type: ignore
 
     def draw_lines(self, points: list[PointType], color='black', width=1) -> int:
@@ -3032,7 +3527,14 @@ class Graph(Element):
         return self.widget.create_line(points, fill=color, width=width)  # type: ignore
 
     def draw_point(self, point: PointType, size: int = 2, color: str = 'black') -> int:
-        """Draw a point."""
+        """Draw a point. (batched draws return 0 instead of an item id)"""
+        if self._batch is not None:
+            style = (color, size)
+            if self._batch and (self._batch[-1][0] == "point") and (self._batch[-1][1] == style):
+                self._batch[-1][2].append(point)
+            else:
+                self._batch.append(("point", style, [point]))
+            return 0
         x, y = point
         size2: float = size / 2
         return self.widget.create_oval(x-size2, y-size2, x+size2, y+size2, fill=color)  # type: ignore
@@ -3065,7 +3567,7 @@ class Graph(Element):
     def draw_text(self, text: str, location: PointType, color: Union[str, None]='black', font: Union[FontType, None] = None, angle: Union[float, str, None] = 0, text_location: TextAlign = tk.CENTER) -> int:
         """Draw text"""
         x, y = location
-        anchor = {"left": "w", "right": "e", "center": "center"}[text_location]
+        anchor = _JUSTIFY_TO_ANCHOR[text_location]
         return self.widget.create_text(x, y, text=text, font=font, fill=color, angle=angle, anchor=anchor)  # type: ignore
     
     def draw_image(self, filename: Union[str, None] = None, data: Union[bytes, None] = None, location: Union[PointType, None] = None) -> int:
@@ -3110,6 +3612,7 @@ class Image(Element):
         self.source = source
         self.filename = filename
         self.data = data
+        self._image_source_key: Union[tuple, None] = None # last drawn source (@see set_image)
         self.size = self.props["size"] = size
         if isinstance(background_color, tuple):
             background_color = rgb(
@@ -3118,14 +3621,7 @@ class Image(Element):
         if background_color is not None:
             self.props["background"] = background_color
         if enable_events:
-            self.bind_events(
-                {
-                    "<ButtonPress>": "mousedown",
-                    "<ButtonRelease>": "mouseup",
-                    "<Motion>": "mousemove",
-                },
-                "system",
-            )
+            self.bind_events(_MOUSE_MOVE_BINDS, "system")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         """Create a Image widget."""
@@ -3142,6 +3638,7 @@ class Image(Element):
 
     def erase(self) -> None:
         """Erase image"""
+        self._image_source_key = None
         self.widget.delete("all") # type: ignore
 
     def screenshot(self) -> PIL.Image.Image:
@@ -3177,15 +3674,26 @@ class Image(Element):
                 background_color = rgb(
                     background_color[0], background_color[1], background_color[2])
             self.background_color = background_color
-        # erase
-        self.erase()
         # load
         if size is None:
             size = self.size
+        # skip redraw when the same source is already displayed
+        src_filename, src_data = filename, data
+        if source is not None:
+            if isinstance(source, str):
+                src_filename = source
+            else:
+                src_data = source
+        src_key = _photo_image_cache_key(src_filename, src_data, size, resize_type, self.background_color)
+        if (src_key is not None) and (src_key == self._image_source_key):
+            return
+        # erase
+        self.erase()
         photo = get_image_tk(source, filename, data, size=size, resize_type=resize_type, background_color=self.background_color)
         if photo is not None:
             self.widget.create_image(0, 0, image=photo, anchor="nw")
             self.widget.photo = photo # type ignore
+            self._image_source_key = src_key
 
     def update(
         self,
@@ -3212,11 +3720,9 @@ class Image(Element):
             self.set_image(source=source, filename=filename, data=data, size=self.size, resize_type=resize_type, background_color=background_color)
         self._widget_update(**kw)
     
-    def __getattr__(self, name):
-        """Get unknown attribute."""
-        if name in ["Widget", "tk_canvas", "tktext_label"]:
-            return self.widget
-        return super().__getattr__(name)
+    # @see Element.Widget (compatibility with PySimpleGUI)
+    tk_canvas = property(lambda self: self.widget)
+    tktext_label = property(lambda self: self.widget)
 
 class VSeparator(Element):
     """VSeparator element."""
@@ -3265,6 +3771,8 @@ class HSeparator(Element):
         return self.widget
 
 
+_VIRTUAL_PAGE_ROWS = 200 # rows inserted per page in virtual Listbox/Table mode
+
 class Listbox(Element):
     """Listbox element."""
     def __init__(
@@ -3275,6 +3783,7 @@ class Listbox(Element):
         key: Union[str, None] = None,
         enable_events: bool = False,
         select_mode: ListboxSelectMode = LISTBOX_SELECT_MODE_BROWSE,
+        virtual: bool = False,  # insert rows page by page while scrolling (for huge lists)
         # other
         metadata: Union[dict[str, Any], None] = None,
         items: Union[list[str], None] = None,  # same as values (alias values)
@@ -3285,14 +3794,14 @@ class Listbox(Element):
         if items is not None: # alias
             self.values = items
         self.select_mode = select_mode
+        self.virtual = virtual
+        self._loaded_count = 0
         if default_value is not None:
             default_values = [default_value]
         self.default_values = default_values
         # event
         if enable_events:
-            self.bind_events({
-                "<<ListboxSelect>>": "select"
-            }, "system")
+            self.bind_events(_SELECT_BINDS, "system")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         """[Listbox.create] create Listbox widget"""
@@ -3302,7 +3811,11 @@ class Listbox(Element):
         # create listbox and scrollbar
         self.widget:tk.Listbox = tk.Listbox(self.widget_frame, selectmode=self.select_mode, **self.props)
         self.widget_scrollbar = tk.Scrollbar(self.widget_frame,command=self.widget.yview)
-        self.widget.config(yscrollcommand=self.widget_scrollbar.set)
+        if self.virtual:
+            # page in further rows as the view nears the bottom
+            self.widget.config(yscrollcommand=self._on_yscroll)
+        else:
+            self.widget.config(yscrollcommand=self.widget_scrollbar.set)
         # pack
         self.widget.pack(side="left", fill="both", expand=True)
         self.widget_scrollbar.pack(side="right", fill="y")
@@ -3311,6 +3824,21 @@ class Listbox(Element):
         self.select_values(self.default_values)
         return self.widget_frame
 
+    def _on_yscroll(self, first: str, last: str) -> None:
+        """Forward scroll state and load the next page near the bottom."""
+        self.widget_scrollbar.set(first, last)
+        if float(last) > 0.9:
+            self._load_next_page()
+
+    def _load_next_page(self) -> None:
+        """Insert the next page of values in virtual mode."""
+        loaded = self._loaded_count
+        if loaded >= len(self.values):
+            return
+        page = self.values[loaded:loaded + _VIRTUAL_PAGE_ROWS]
+        self.widget.insert("end", *page)
+        self._loaded_count = loaded + len(page)
+
     def select_values(self, values: Union[list[str], None]) -> None:
         """
         Select values in Listbox.
@@ -3330,22 +3858,40 @@ class Listbox(Element):
             return
         if values is None:
             return
-        for v in values:
-            try:
-                index = self.values.index(v)
-                self.widget.selection_set(index)
-            except ValueError:
-                pass
+        # map values to indexes in one pass (list.index is O(N) per lookup)
+        idx_map: dict[str, int] = {}
+        for i, v in enumerate(self.values):
+            if v not in idx_map: # keep the first occurrence like list.index
+                idx_map[v] = i
+        indexes = sorted({idx_map[v] for v in values if v in idx_map})
+        if not indexes:
+            return
+        # group consecutive runs - one selection_set call per run
+        selection_set = self.widget.selection_set
+        run_start = prev = indexes[0]
+        for index in indexes[1:]:
+            if index == prev + 1:
+                prev = index
+                continue
+            selection_set(run_start, prev)
+            run_start = prev = index
+        selection_set(run_start, prev)
 
     def set_values(self, values: list[str]) -> None:
         """Set values to list"""
+        if (values is not self.values) and (values == self.values):
+            return # a distinct but equal list - nothing to redraw
         self.values = values
         if self.widget is not None:
             # delete all
-            self.widget.delete(0, "end")
-            # insert data
-            for i, v in enumerate(self.values):
-                self.widget.insert(i, v)
+            if self.widget.size() > 0:
+                self.widget.delete(0, "end")
+            # insert data - one Tcl call instead of one per row
+            if self.virtual:
+                self._loaded_count = 0
+                self._load_next_page()
+            elif self.values:
+                self.widget.insert("end", *self.values)
 
     def get_cursor_index(self) -> int:
         """Get cursor index (return -1 if not selected)"""
@@ -3416,9 +3962,7 @@ class Combo(Element):
         self.readonly: bool = readonly
         # event
         if enable_events:
-            self.bind_events({
-                "<<ComboboxSelected>>": "select"
-            }, "system")
+            self.bind_events(_COMBO_BINDS, "system")
 
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         """[Combo.create] create Listbox widget"""
@@ -3435,7 +3979,10 @@ class Combo(Element):
         """Set values to list"""
         self.values = values
         if self.widget is not None:
-            self._widget_update(values=self.values)
+            self.props["values"] = values # keep props in sync for _widget_update's diff
+            # bypass the ttk configure wrapper - one direct Tcl call
+            widget = self.widget
+            widget.tk.call(widget._w, "configure", "-values", tuple(values))
     
     def set_value(self, v: str) -> None:
         """Set the value of the widget."""
@@ -3454,6 +4001,8 @@ class Combo(Element):
     def set_readonly(self, readonly: bool) -> None:
         """set readonly"""
         self.readonly = readonly
+        if self.widget is None: # create() applies self.readonly later
+            return
         state = "readonly" if self.readonly else "normal"
         self._widget_update(state=state)
 
@@ -3487,6 +4036,7 @@ class Table(Element):
                 select_mode: str="browse",
                 max_columns: int = 20, # This property cannot be changed later. It is advisable to set a larger value.
                 vertical_scroll_only: bool = True, # vertical scroll only
+                virtual: bool = False, # insert rows page by page while scrolling (for huge tables)
                 # text props
                 text_align: Union[TextAlign, None] = "left", # text align
                 font: Union[FontType, None] = None, # font
@@ -3513,6 +4063,9 @@ class Table(Element):
         self.col_widths = col_widths
         self.has_font_prop = False # has, but not widget root
         self.vertical_scroll_only = vertical_scroll_only
+        self.virtual = virtual
+        self._loaded_rows = 0
+        self._headers_applied: Union[list[tuple[str, int]], None] = None
         self.max_columns = max_columns
         self.col_widths_real: list[int] = []
         # check headings length
@@ -3528,9 +4081,9 @@ class Table(Element):
         # justification
         self.justification = "center"
         if justification is not None:
-            self.justification = self._justify_to_anchor(justification)
+            self.justification = _JUSTIFY_TO_ANCHOR.get(justification, "center")
         if text_align is not None:
-            self.justification = self._justify_to_anchor(justification)
+            self.justification = _JUSTIFY_TO_ANCHOR.get(justification, "center")
         # set props
         self._set_text_props(font=font, color=color, text_color=text_color, background_color=background_color)
         self._set_pack_props(expand_x=expand_x, expand_y=expand_y, pad=pad)
@@ -3555,7 +4108,12 @@ class Table(Element):
         self.props["font"] = font
         # - SCROLLBAR
         scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscroll=scrollbar.set) # type: ignore
+        self._scrollbar = scrollbar
+        if self.virtual:
+            # page in further rows as the view nears the bottom
+            tree.configure(yscroll=self._on_yscroll) # type: ignore
+        else:
+            tree.configure(yscroll=scrollbar.set) # type: ignore
         if not self.vertical_scroll_only:
             hscrollbar = ttk.Scrollbar(self.frame, orient="horizontal", command=tree.xview)
             tree.configure(xscroll=hscrollbar.set) # type: ignore
@@ -3589,37 +4147,57 @@ class Table(Element):
                     ]
                 )
             )
-        # set heading
+        # set heading - bind the methods once, the loop runs per column
         widget: ttk.Treeview = self.widget  # type: ignore
+        heading = widget.heading
+        column = widget.column
+        n_headings = len(headings)
+        col_widths_real = self.col_widths_real
+        n_widths = len(col_widths_real)
+        applied = self._headers_applied # last (label, width) per column, or None
+        new_applied = []
         for i in range(self.max_columns):
-            label = headings[i] if len(headings) > i else ""
-            widget.heading(i + 1, text=label, anchor="center")
+            label = headings[i] if n_headings > i else ""
             if label == "":
-                widget.column(i + 1, width=0, stretch=tk.NO)
-                continue
-            w = self.col_widths_real[i] if i < len(self.col_widths_real) else 100
-            widget.column(i + 1, width=w, stretch=streatch, anchor=self.justification)
+                w = 0
+            else:
+                w = col_widths_real[i] if i < n_widths else 100
+            new_applied.append((label, w))
+            if (applied is not None) and (i < len(applied)) and (applied[i] == (label, w)):
+                continue # unchanged column - skip both Tcl calls
+            heading(i + 1, text=label, anchor="center")
+            if label == "":
+                column(i + 1, width=0, stretch=tk.NO)
+            else:
+                column(i + 1, width=w, stretch=streatch, anchor=self.justification)
+        self._headers_applied = new_applied
 
     def _calc_col_width(self) -> None:
         """Calc columns width"""
-        self.col_widths_real = [0 for _ in range(self.max_columns)]
         # get font size
         font_w = 12
         if (self.font is not None) and (len(self.font) >= 2):
             font_w = self.font[1]
-        # check text length
-        for i in range(self.max_columns):
-            # use default size
-            if self.col_widths is not None:
-                self.col_widths_real[i] = self.col_widths[i] * font_w if i < len(self.col_widths) else 100
-                continue
-            # header size
-            label = self.headings[i] if i < len(self.headings) else ""
-            max_len: int = len(str(label))
-            for row in self.values:
-                text = row[i] if i < len(row) else ""
-                max_len = max(len(str(text)), max_len)
-            self.col_widths_real[i] = max_len * font_w
+        # use default size
+        if self.col_widths is not None:
+            col_widths = self.col_widths
+            self.col_widths_real = [
+                col_widths[i] * font_w if i < len(col_widths) else 100
+                for i in range(self.max_columns)
+            ]
+            return
+        # one pass over the rows - start from the header sizes
+        headings = self.headings
+        max_columns = self.max_columns
+        widths = [len(str(headings[i])) if i < len(headings) else 0 for i in range(max_columns)]
+        for row in self.values:
+            for i, cell in enumerate(row):
+                if i >= max_columns:
+                    break
+                n = len(cell) if isinstance(cell, str) else len(str(cell))
+                if n > widths[i]:
+                    widths[i] = n
+        self.col_widths_real = [w * font_w for w in widths]
 
     def set_values(self, values: list[list[str]], headings: Union[list[str], None] = None) -> None:
         """Set values to the table."""
@@ -3631,18 +4209,42 @@ class Table(Element):
             self.headings = headings
         self._calc_col_width()
         widget: ttk.Treeview = self.widget
-        # clear all rows
-        for row in widget.get_children():
-            widget.delete(row)
+        # clear all rows - Treeview.delete accepts varargs
+        children = widget.get_children()
+        if children:
+            widget.delete(*children)
         # update heading
         if headings is not None:
             self._update_headers()
-        # add data
-        for row_no, row_values in enumerate(self.values):
-            widget.insert(parent="", iid=row_no, index="end", values=row_values)
+        # add data - hand each row to Tcl as a string tuple, converted once
+        if self.virtual:
+            self._loaded_rows = 0
+            self._load_next_rows()
+        else:
+            insert = widget.insert # hoist the method lookup for big tables
+            for row_no, row_values in enumerate(self.values):
+                insert(parent="", iid=row_no, index="end", values=tuple(map(str, row_values)))
         # update
         widget.update_idletasks()
     
+    def _on_yscroll(self, first: str, last: str) -> None:
+        """Forward scroll state and load the next rows near the bottom."""
+        self._scrollbar.set(first, last)
+        if float(last) > 0.9:
+            self._load_next_rows()
+
+    def _load_next_rows(self) -> None:
+        """Insert the next page of rows in virtual mode."""
+        loaded = self._loaded_rows
+        values = self.values
+        if loaded >= len(values):
+            return
+        stop = min(loaded + _VIRTUAL_PAGE_ROWS, len(values))
+        insert = self.widget.insert
+        for row_no in range(loaded, stop):
+            insert(parent="", iid=row_no, index="end", values=tuple(map(str, values[row_no])))
+        self._loaded_rows = stop
+
     def get(self) -> Any:
         """Get the value of the widget."""
         if self.widget is None:
@@ -3679,12 +4281,7 @@ class Table(Element):
             self._update_headers()
         if "values" in kw:
             self.values = kw["values"]
-            # update list
-            if self.widget is not None:
-                tree = self.widget
-                for i in tree.get_children(): # clear all
-                    tree.delete(i)
-            # set values
+            # set values (set_values clears the old rows itself)
             self.set_values(self.values)
             del kw["values"]
         # update
@@ -3713,6 +4310,8 @@ class Table(Element):
 #------------------------------------------------------------------------------
 # Browse elements
 
+_DEFAULT_FILE_TYPES: tuple[tuple[str, str]] = (("All Files", "*.*"),)
+
 class FileBrowse(Element):
     """
     FileBrowse element.
@@ -3722,7 +4321,7 @@ class FileBrowse(Element):
                 key: Union[str, int, None] = None,
                 title: str = "",
                 target_key: Union[str, None] = None,
-                file_types: tuple[tuple[str, str]] = (("All Files", "*.*"),),
+                file_types: tuple[tuple[str, str]] = _DEFAULT_FILE_TYPES,
                 multiple_files: bool = False,
                 initial_folder: Union[str, None] = None,
                 save_as: bool = False,
@@ -3746,13 +4345,9 @@ class FileBrowse(Element):
     def create(self, win: Window, parent: tk.Widget) -> tk.Widget:
         self.widget = tk.Button(parent, **self.props)
         # hook
-        event_name = "--browse_action/hide"
-        self.bind_events({
-            "<Button-1>": event_name,
-            "<Return>": event_name,
-        })
+        self.bind_events(_BROWSE_BINDS)
         win.register_event_hooks({
-            f"{self.key}{event_name}": [self.show_dialog]
+            f"{self.key}--browse_action/hide": [self.show_dialog]
         })
         return self.widget
     
@@ -3793,13 +4388,18 @@ class FileBrowse(Element):
     
     def set_text(self, text: str) -> None:
         """Set the text of the button."""
-        self.props["text"] = text
+        if self.widget is None: # before create(), props alone is enough
+            self.props["text"] = text
+            return
         self._widget_update(text=text)
 
     def update(self, text: Union[str, None] = None, **kw) -> None:
         """Update the widget."""
         if text is not None:
-            self.set_text(text)
+            if self.widget is None: # before create(), props alone is enough
+                self.props["text"] = text
+            else:
+                kw["text"] = text # fold into the single configure pass below
         self._widget_update(**kw)
 
 class FilesBrowse(FileBrowse):
@@ -3810,7 +4410,7 @@ class FilesBrowse(FileBrowse):
                 key: Union[str, None] = None,
                 target_key: Union[str, None] = None,
                 title: str="",
-                file_types: tuple[tuple[str, str]] = (("All Files", "*.*"),),
+                file_types: tuple[tuple[str, str]] = _DEFAULT_FILE_TYPES,
                 enable_events: bool = False, # enable changing events
                 # other
                 metadata: Union[dict[str, Any], None] = None,
@@ -3834,7 +4434,7 @@ class FileSaveAsBrowse(FileBrowse):
                 key: Union[str, None] = None,
                 target_key: Union[str, None] = None,
                 title: str = "",
-                file_types: tuple[tuple[str, str]] = (("All Files", "*.*"),),
+                file_types: tuple[tuple[str, str]] = _DEFAULT_FILE_TYPES,
                 enable_events: bool = False, # enable changing events
                 # other
                 metadata: Union[dict[str, Any], None] = None,
@@ -3953,13 +4553,26 @@ class ListBrowse(FileBrowse):
         self.message = message
         self.font = font
         self.default_value = default_value
+        # membership set for show_dialog - built lazily, rebuilt when values changes
+        self._values_set: Union[set, None] = None
+        self._values_src: Union[list, None] = None
+        self._values_src_len: int = -1
+
+    def _get_values_set(self) -> set:
+        """Get a set of values for O(1) membership checks."""
+        values = self.values
+        if (self._values_set is None) or (self._values_src is not values) or (self._values_src_len != len(values)):
+            self._values_set = set(values)
+            self._values_src = values
+            self._values_src_len = len(values)
+        return self._values_set
 
     def show_dialog(self, *args) -> Union[str, None]:
         """Show Listbox dialog"""
         target: Union[Element, None] = self.get_prev_element(self.target_key)
         if target is not None:
             val = target.get() # type: ignore[attr-defined]
-            if (val != "") and (val in self.values):
+            if (val != "") and (val in self._get_values_set()):
                 self.default_value = val
         # popup
         result = dialogs.popup_listbox(
@@ -3976,6 +4589,9 @@ class ListBrowse(FileBrowse):
                     self.window._event_handler(self.key, {"event": result, "event_type": "change"})
         return result
 
+# strip CR and escape LF in one pass @see MultilineBrowse.show_dialog
+_MULTILINE_TRANS = str.maketrans({"\r": None, "\n": "\\n"})
+
 class MultilineBrowse(FileBrowse):
     """MultilineBrowse element."""
 
@@ -4015,8 +4631,7 @@ class MultilineBrowse(FileBrowse):
             font=self.font,
         )
         if (target is not None) and (result is not None) and (result != ""):
-            result = result.replace("\r", "")
-            result = result.replace("\n", "\\n")
+            result = result.translate(_MULTILINE_TRANS)
             target.update(result) # type: ignore[call-arg]
             if self.enable_events:
                 if (self.window is not None) and (self.key is not None):
@@ -4070,12 +4685,19 @@ class CalendarButton(CalendarBrowse):
     pass
 
 
+_HEX2 = tuple(f"{i:02x}" for i in range(256)) # two-digit hex table @see rgb
+
 def rgb(r: int, g: int, b: int) -> str:
     """Convert RGB to Hex"""
-    r = r & 0xFF
-    g = g & 0xFF
-    b = b & 0xFF
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return "#" + _HEX2[r & 0xFF] + _HEX2[g & 0xFF] + _HEX2[b & 0xFF]
+
+def _draft_downscale(img: PIL.Image.Image, w: int, h: int) -> None:
+    """Let the JPEG decoder skip pixels when shrinking (no-op for other formats)."""
+    if (w < img.size[0]) and (h < img.size[1]):
+        try:
+            img.draft(None, (w, h))
+        except Exception:
+            pass
 
 def image_resize(
     img: PIL.Image.Image,
@@ -4084,6 +4706,7 @@ def image_resize(
     background_color: Union[str, None] = None, # color (example) "red" or "#FF0000"
 ) -> PIL.Image.Image:
     """Resize image"""
+    _load_pil()
     # check background color
     if background_color is None:
         background_color = "white"
@@ -4099,6 +4722,7 @@ def image_resize(
         r = size[1] / img.size[1]
         w, h = int(img.size[0] * r), size[1]
         x, y = (size[0] - w) // 2, (size[1] - h) // 2
+        _draft_downscale(img, w, h)
         resize_im = img.resize(size=(w, h))
         view_im = PIL.Image.new("RGBA", size, background_color_rgba)
         view_im.paste(resize_im, (x, y))
@@ -4107,6 +4731,7 @@ def image_resize(
         r = size[0] / img.size[0]
         w, h = size[0], int(img.size[1] * r)
         x, y = (size[0] - w) // 2, (size[1] - h) // 2
+        _draft_downscale(img, w, h)
         resize_im = img.resize(size=(w, h))
         view_im = PIL.Image.new("RGBA", size, background_color_rgba)
         view_im.paste(resize_im, (x, y))
@@ -4118,6 +4743,7 @@ def image_resize(
         r = min(wr, hr) # select min
         w, h = int(img.size[0] * r), int(img.size[1] * r)
         x, y = (size[0] - w) // 2, (size[1] - h) // 2
+        _draft_downscale(img, w, h)
         resize_im = img.resize(size=(w, h))
         view_im = PIL.Image.new("RGBA", size, background_color_rgba)
         view_im.paste(resize_im, (x, y))
@@ -4134,6 +4760,29 @@ def image_resize(
         return img.resize(size=(size[0], size[0]))
     return img
 
+_photo_image_cache: dict[tuple, Any] = {} # decoded PhotoImage per source (@see get_image_tk)
+_PHOTO_IMAGE_CACHE_MAX = 128
+
+def _photo_image_cache_key(
+    filename: Union[str, None],
+    data: Union[bytes, Any, None],
+    size: Union[tuple[int, int], None],
+    resize_type: ImageResizeType,
+    background_color: Union[str, None],
+) -> Union[tuple, None]:
+    """Build a cache key for get_image_tk, or None when the source is not cacheable."""
+    if filename is not None:
+        try:
+            mtime = os.path.getmtime(filename) # invalidates when the file changes
+        except OSError:
+            return None
+        return ("file", filename, mtime, size, resize_type, background_color)
+    if isinstance(data, bytes):
+        import hashlib
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        return ("data", digest, size, resize_type, background_color)
+    return None # PIL.Image objects are mutable - do not cache
+
 def get_image_tk(
     source: Union[bytes, Union[str, None]] = None,
     filename: Union[str, None] = None,
@@ -4141,7 +4790,7 @@ def get_image_tk(
     size: Union[tuple[int, int], None] = None,
     resize_type: ImageResizeType = ImageResizeType.FIT_BOTH,
     background_color: Union[str, None] = None,  # color (example) "red" or "#FF0000"
-) -> Union[ImageTk.PhotoImage, None]:
+) -> Union[ImageTk.PhotoImage, tk.PhotoImage, None]:
     """Get Image for tk"""
     img: PIL.Image.Image
     # if source is bytes, set data
@@ -4150,8 +4799,28 @@ def get_image_tk(
             filename = source
         else: # is data
             data = source
+    # check the cache - repeat draws of the same source skip the PIL decode
+    cache_key = _photo_image_cache_key(filename, data, size, resize_type, background_color)
+    if cache_key is not None:
+        photo = _photo_image_cache.get(cache_key)
+        if photo is not None:
+            return photo
+    photo = None
+    # PNG/GIF with no processing - Tk's native loader skips the PIL decode entirely
+    if (
+        (filename is not None)
+        and (size is None)
+        and (background_color is None)
+        and filename.lower().endswith((".png", ".gif"))
+    ):
+        try:
+            photo = tk.PhotoImage(file=filename)
+        except tk.TclError:
+            photo = None # unsupported variant - fall back to the PIL loader
+    if photo is None:
+        _load_pil()
     # load from file?
-    if filename is not None:
+    if (photo is None) and (filename is not None):
         try:
             img = PIL.Image.open(filename)
             img = image_resize(
@@ -4160,11 +4829,11 @@ def get_image_tk(
                 resize_type=resize_type,
                 background_color=background_color,
             )
-            return ImageTk.PhotoImage(image=img)
+            photo = ImageTk.PhotoImage(image=img)
         except Exception as e:
             raise TkEasyError(f"TkEasyGUI.Image.set_image.Error: filename='{filename}', {e}")
     # load from data
-    if data is not None:
+    elif data is not None:
         try:
             # check if data is PIL.Image
             if isinstance(data, PIL.Image.Image):
@@ -4175,57 +4844,105 @@ def get_image_tk(
                     resize_type=resize_type,
                     background_color=background_color,
                 )
-                return ImageTk.PhotoImage(image=img)
-            return ImageTk.PhotoImage(data=data)
+                photo = ImageTk.PhotoImage(image=img)
+            else:
+                photo = ImageTk.PhotoImage(data=data)
         except Exception as e:
             print("[TkEasyGUI] get_image_tk.Error:", e, file=sys.stderr)
             return None
-    return None
+    # store in the cache
+    if (photo is not None) and (cache_key is not None):
+        if len(_photo_image_cache) >= _PHOTO_IMAGE_CACHE_MAX:
+            _photo_image_cache.pop(next(iter(_photo_image_cache))) # drop the oldest entry
+        _photo_image_cache[cache_key] = photo
+    return photo
 
 def imagedata_to_bytes(image_data: PIL.Image.Image) -> bytes:
     """Convert JPEG to PNG"""
+    _load_pil()
     bytes_data = io.BytesIO()
     image_data.save(bytes_data, format="PNG")
     img_bytes = bytes_data.getvalue()
     return img_bytes
 
+_imagefile_bytes_cache: dict[str, tuple[float, bytes]] = {} # filename -> (mtime, png bytes)
+_IMAGEFILE_BYTES_CACHE_MAX = 32
+
 def imagefile_to_bytes(filename: str) -> bytes:
     """Read image file and convert to bytes"""
-    image = PIL.Image.open(filename)
-    bytes_data = io.BytesIO()
-    image.save(bytes_data, format="PNG")
-    img_bytes = bytes_data.getvalue()
+    _load_pil()
+    mtime: Union[float, None]
+    try:
+        mtime = os.path.getmtime(filename) # invalidates when the file changes
+        cached = _imagefile_bytes_cache.get(filename)
+        if (cached is not None) and (cached[0] == mtime):
+            return cached[1]
+    except OSError:
+        mtime = None
+    img_bytes = b""
+    try:
+        with open(filename, "rb") as f:
+            head = f.read(8)
+            if head == b"\x89PNG\r\n\x1a\n": # already PNG - skip the decode/re-encode pass
+                img_bytes = head + f.read()
+    except OSError:
+        pass
+    if not img_bytes:
+        image = PIL.Image.open(filename)
+        bytes_data = io.BytesIO()
+        image.save(bytes_data, format="PNG")
+        img_bytes = bytes_data.getvalue()
+    if mtime is not None:
+        if len(_imagefile_bytes_cache) >= _IMAGEFILE_BYTES_CACHE_MAX:
+            _imagefile_bytes_cache.pop(next(iter(_imagefile_bytes_cache))) # drop the oldest entry
+        _imagefile_bytes_cache[filename] = (mtime, img_bytes)
     return img_bytes
 
-def time_checker_start() -> datetime:
+def time_checker_start() -> int:
     """timer start"""
-    return datetime.now()
+    return time.monotonic_ns()
 
-def time_checker_end(start_time: datetime) -> int:
-    """timer end"""
-    elapsed_time = (datetime.now() - start_time).total_seconds()
-    msec = int(elapsed_time * 1000)
-    return msec
+def time_checker_end(start_time: int) -> int:
+    """timer end (msec)"""
+    return (time.monotonic_ns() - start_time) // 1_000_000
 
 # get system info
 
+@lru_cache(maxsize=1)
 def get_tk_version() -> str:
     """Get tk version"""
     root = get_root_window()
     tkversion = root.tk.call("info", "patchlevel")
     return tkversion
 
+@lru_cache(maxsize=1)
 def get_tcl_version() -> str:
     """Get tcl version"""
     root = get_root_window()
     tclversion = root.tk.call("info", "tclversion")
     return tclversion
 
-def get_font_list() -> list[str]:
-    """Get font list"""
+@lru_cache(maxsize=1)
+def _get_font_families() -> tuple[str, ...]:
+    """Query the font families once - the set does not change while running."""
     root = get_root_window()
     root.withdraw()
-    return list(tkfont.families())
+    return tuple(tkfont.families())
+
+def get_font_list() -> list[str]:
+    """Get font list"""
+    return list(_get_font_families())
+
+@lru_cache(maxsize=1)
+def _platform_info() -> str:
+    """Collect the static platform fields (architecture/processor may spawn a subprocess)."""
+    return "\n".join([
+        f"os={platform.system()}",
+        f"os_version={platform.version()}",
+        f"os_release={platform.release()}",
+        f"architecture={platform.architecture()}",
+        f"processor={platform.processor()}",
+    ])
 
 def get_system_info():
     # node={platform.node()}
@@ -4234,11 +4951,7 @@ def get_system_info():
 tkeasygui={version.__version__}
 python={py_ver}
 tcl_tk={get_tk_version()}
-os={platform.system()}
-os_version={platform.version()}
-os_release={platform.release()}
-architecture={platform.architecture()}
-processor={platform.processor()}
+{_platform_info()}
     """.strip()
 
 _compatibility = utils._compatibility
@@ -4,6 +4,8 @@ make elements.json and elements_test.py
 """
 import json
 import os
+import subprocess
+import sys
 
 SCRIPT_DIR = os.path.dirname(__file__)
 
@@ -12,39 +14,34 @@ FILE_ELEMENTS = os.path.join(SCRIPT_DIR, "docs", "scripts", "elements.json")
 
 COLS_PER_ROW = 4
 
+# extra constructor arguments per element (one dict lookup per element)
+EXTRA_ARGS = {
+    "Button": ("'Button'",),
+    "Text": ("'Text'",),
+    "Input": ("'Input'",),
+    "Frame": ("'Frame'", "layout=[[eg.Button('OK')]]"),
+    "Checkbox": ("'Checkbox'",),
+    "Label": ("'Label'",),
+    "InputText": ("'InputText'",),
+    "Multiline": ("'Multiline'",),
+    "Column": ("layout=[[eg.Button('OK')]]",),
+    "Menu": ("menu_definition=[['File', ['Open', 'Save', 'Exit']], ['Edit', ['Copy', 'Paste']]]",),
+    "Table": ("values=[[1,2,3],[4,5,6],[7,8,9]]", "headings=['aaa', 'bbb', 'ccc']"),
+    "Image": ("filename='a.png'", "size=(100,100)"),
+    "Canvas": ("size=(100,100)",),
+    "Graph": ("size=(100,100)",),
+    "Combo": ("values=['combo1', 'combo2', 'combo3']", "default_value='combo1'"),
+    "Listbox": ("values=['item1', 'item2', 'item3']",),
+    "ListBrowse": ("values=['item1', 'item2', 'item3']",),
+    "Tab": ("title='tab'", "layout=[[eg.Button('OK')]]"),
+    "TabGroup": ("layout=[[ eg.Tab('tab1', layout=[[eg.Button('OK')]]) ]]",),
+}
+
 def read_file() -> str:
     # read elements.json
     with open(FILE_ELEMENTS, "r", encoding="utf-8") as fp:
         elements = json.load(fp)
-    args = {}
-    for e in elements:
-        args[e] = []
-        if e in ["Button", "Text", "Input", "Frame", "Checkbox", "Label", "InputText", "Multiline"]:
-            args[e].append(f"'{e}'")
-        if e in ["Column", "Frame"]:
-            args[e].append("layout=[[eg.Button('OK')]]")
-        if e in ["Menu"]:
-            args[e].append("menu_definition=[['File', ['Open', 'Save', 'Exit']], ['Edit', ['Copy', 'Paste']]]")
-        if e in ["Table"]:
-            args[e].append("values=[[1,2,3],[4,5,6],[7,8,9]]")
-            args[e].append("headings=['aaa', 'bbb', 'ccc']")
-        if e in ["Image"]:
-            args[e].append("filename='a.png'")
-            args[e].append("size=(100,100)")
-        if e in ["Canvas"]:
-            args[e].append("size=(100,100)")
-        if e in ["Graph"]:
-            args[e].append("size=(100,100)")
-        if e in ["Combo"]:
-            args[e].append("values=['combo1', 'combo2', 'combo3']")
-            args[e].append("default_value='combo1'")
-        if e in ["Listbox", "ListBrowse"]:
-            args[e].append("values=['item1', 'item2', 'item3']")
-        if e in ["Tab"]:
-            args[e].append("title='tab'")
-            args[e].append("layout=[[eg.Button('OK')]]")
-        if e in ["TabGroup"]:
-            args[e].append("layout=[[ eg.Tab('tab1', layout=[[eg.Button('OK')]]) ]]")
+    args = {e: list(EXTRA_ARGS.get(e, ())) for e in elements}
     return elements, args
 
 def make_code():
@@ -76,8 +73,14 @@ for event, values in window.event_iter():
 """
     print(f"==={TEST_FILENAME}===")
     print(src)
-    with open("elements_test.py", "w", encoding="utf-8") as f:
-        f.write(src)
-    os.system("python elements_test.py")
+    # write only when the output changed - keeps the mtime stable for watchers
+    old_src = None
+    if os.path.exists(TEST_FILENAME):
+        with open(TEST_FILENAME, "r", encoding="utf-8") as f:
+            old_src = f.read()
+    if old_src != src:
+        with open(TEST_FILENAME, "w", encoding="utf-8") as f:
+            f.write(src)
+    subprocess.run([sys.executable, TEST_FILENAME], check=False)
 if __name__ == "__main__":
     make_code()